@@ -20,6 +20,10 @@ if hasattr(Qt, 'AA_UseHighDpiPixmaps'):
     QApplication.setAttribute(Qt.AA_UseHighDpiPixmaps, True)
     print('Using high dpi Pixmaps')
 
+# QtWebEngine is imported with the help page after the application was created,
+# it requires shared OpenGL contexts to be set before that
+QApplication.setAttribute(Qt.AA_ShareOpenGLContexts, True)
+
 VERSION = '1.572'
 
 InfoMessage.ver = VERSION
@@ -3,8 +3,9 @@ import numpy as np
 from pathlib import Path
 from time import time
 from datetime import datetime
+from typing import Dict
 
-from PySide2.QtCore import QFile, QObject, Slot, QEvent, Signal, QTimer, Qt
+from PySide2.QtCore import QBuffer, QByteArray, QFile, QObject, Slot, QEvent, Signal, QTimer, Qt
 from PySide2.QtGui import QMouseEvent
 from PySide2.QtWidgets import QWidget
 
@@ -23,6 +24,21 @@ def replace_widget(old_widget, new_widget):
 
 
 class SetupWidget(QObject):
+    # Contents of already read Ui files by file name
+    ui_data_storage: Dict[str, QByteArray] = dict()
+
+    @classmethod
+    def _read_ui_file(cls, ui_file) -> QByteArray:
+        """ Read the Ui file contents once, re-use them for every further widget """
+        if ui_file not in cls.ui_data_storage:
+            ui_path = Path(get_current_modules_dir()) / UI_PATH / ui_file
+            file = QFile(ui_path.as_posix())
+            file.open(QFile.ReadOnly)
+            cls.ui_data_storage[ui_file] = file.readAll()
+            file.close()
+
+        return cls.ui_data_storage[ui_file]
+
     @staticmethod
     def from_ui_file(widget_cls, ui_file, custom_widgets=dict()):
         """ Load a Qt .ui file to setup the provided widget """
@@ -30,12 +46,12 @@ class SetupWidget(QObject):
         current_log_level = logging.root.getEffectiveLevel()
         logging.root.setLevel(logging.ERROR)
 
-        # Load the Ui file
-        ui_file = Path(get_current_modules_dir()) / UI_PATH / ui_file
-        file = QFile(ui_file.as_posix())
-        file.open(QFile.ReadOnly)
-        loadUi(file, widget_cls, custom_widgets)
-        file.close()
+        # Load the Ui from the cached file contents
+        buffer = QBuffer()
+        buffer.setData(SetupWidget._read_ui_file(ui_file))
+        buffer.open(QBuffer.ReadOnly)
+        loadUi(buffer, widget_cls, custom_widgets)
+        buffer.close()
 
         # Restore previous log level
         logging.root.setLevel(current_log_level)
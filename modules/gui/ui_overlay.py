@@ -1,7 +1,7 @@
 import re
 
 from PySide2 import QtWidgets
-from PySide2.QtCore import QAbstractAnimation, QPropertyAnimation, QTimer, Qt, QUrl
+from PySide2.QtCore import QAbstractAnimation, QEvent, QPropertyAnimation, QTimer, Qt, QUrl
 from PySide2.QtGui import QEnterEvent, QMouseEvent, QMovie, QRegion
 from datetime import datetime
 
@@ -33,6 +33,9 @@ class InfoOverlay(QtWidgets.QWidget):
 
     queue_limit = 12
 
+    # Maximum number of text blocks kept in the message browser
+    msg_browser_block_limit = 500
+
     # Message tab index
     msg_tab_idx = 4
 
@@ -61,6 +64,10 @@ class InfoOverlay(QtWidgets.QWidget):
         self.tab_widget_anim = TabBgrAnimation(self)  # Animate MainWindow TabWidget Tab background color
         self.use_msg_browser = False
 
+        # --- Cache parent object name, used as message browser prefix ---
+        self._parent_obj_name = self.parent.objectName()
+        self.parent.objectNameChanged.connect(self._update_parent_obj_name)
+
         # --- Get header height ---
         self.header_height = 0
         if hasattr(parent, 'header'):
@@ -90,24 +97,34 @@ class InfoOverlay(QtWidgets.QWidget):
         self.click_timer = QTimer()
         self.click_timer.setSingleShot(True)
 
-        # --- Install parent resize wrapper ---
-        self._org_parent_resize_event = self.parent.resizeEvent
-        self.parent.resizeEvent = self._parent_resize_wrapper
+        self.adapt_size_timer = QTimer()
+        self.adapt_size_timer.setSingleShot(True)
+        self.adapt_size_timer.setInterval(0)
+        self.adapt_size_timer.timeout.connect(self._adapt_size)
+
+        self.enable_updates_timer = QTimer()
+        self.enable_updates_timer.setSingleShot(True)
+        self.enable_updates_timer.setInterval(150)
+        self.enable_updates_timer.timeout.connect(self._enable_updates)
 
-        # --- Install Show Event wrapper ---
+        # --- Watch parent resize and show events ---
         # On document tab change, parent widget will not trigger resize event
-        # but maybe was resized while hidden. This wrapper will make sure we adapt
-        # size on tab change.
-        self._org_parent_show_event = self.parent.showEvent
-        self.parent.showEvent = self._parent_show_wrapper
+        # but maybe was resized while hidden. Reacting to the show event will make
+        # sure we adapt size on tab change.
+        self.parent.installEventFilter(self)
 
         # Manually trigger an initial resize event
-        QTimer.singleShot(1, self._adapt_size)
+        self.adapt_size_timer.start()
 
         self.hide_all()
 
     def eventFilter(self, obj, event):
         """ Make Widget transparent on Mouse Move and Enter Event """
+        if obj is self.parent:
+            if event.type() in (QEvent.Resize, QEvent.Show):
+                self._adapt_size()
+            return False
+
         if obj in (self.overlay_grp, self.text_label, self.btn_box):
             # --- Detect Mouse Events ---
             if event.type() == QEnterEvent.Enter or event.type() == QMouseEvent.MouseMove:
@@ -128,16 +145,6 @@ class InfoOverlay(QtWidgets.QWidget):
 
         return False
 
-    def _parent_resize_wrapper(self, event):
-        self._org_parent_resize_event(event)
-        self._adapt_size()
-        event.accept()
-
-    def _parent_show_wrapper(self, event):
-        self._org_parent_show_event(event)
-        self._adapt_size()
-        event.accept()
-
     def _adapt_size(self):
         top_spacing = round(self.parent.frameGeometry().height() * self.y_offset_factor) + self.header_height
         left_spacing = round(self.parent.frameGeometry().width() * self.x_offset_factor)
@@ -156,9 +163,14 @@ class InfoOverlay(QtWidgets.QWidget):
         self.tab_widget_anim = TabBgrAnimation(ui_tab_widget)
         self.msg_tab = ui_tab_widget
         self.msg_browser = message_browser
+        self.msg_browser.document().setMaximumBlockCount(self.msg_browser_block_limit)
         self.msg_browser.anchorClicked.connect(self._msg_browser_anchor_clicked)
+        self._parent_obj_name = self.parent.objectName()
         self.use_msg_browser = True
 
+    def _update_parent_obj_name(self, name: str):
+        self._parent_obj_name = name
+
     def _msg_browser_anchor_clicked(self, url: QUrl):
         anchor_id = url.toDisplayString()[1:]
 
@@ -231,7 +243,8 @@ class InfoOverlay(QtWidgets.QWidget):
             self.show_all()
             self.restore_visibility()
         else:
-            message = f'<b>{self.parent.objectName()} {datetime.now().strftime("(%H:%M:%S)")}:</b><br />{message}'
+            message = '<b>' + self._parent_obj_name + ' ' + datetime.now().strftime('(%H:%M:%S)') + ':</b><br />' \
+                      + message
             self.msg_browser.append(message)
             self.tab_widget_anim.blink()
             if self.msg_tab.currentIndex() != self.msg_tab_idx:
@@ -241,9 +254,9 @@ class InfoOverlay(QtWidgets.QWidget):
         if not called_from_timer and not self.message_active:
             self.overlay_grp.setUpdatesEnabled(False)
             self._init_fade_anim(True)
-            QTimer.singleShot(150, self._enable_updates)
+            self.enable_updates_timer.start()
 
-        QTimer.singleShot(1, self._adapt_size)
+        self.adapt_size_timer.start()
         self.message_active = True
         self.msg_timer.start(duration)
 
@@ -337,9 +350,8 @@ class _OverlayWidget(QtWidgets.QWidget):
                                         QtWidgets.QSizePolicy.Expanding)
         self.movie_screen.hide()
 
-        # Install parent resize wrapper
-        self.org_parent_resize_event = self.parent.resizeEvent
-        self.parent.resizeEvent = self._parent_resize_wrapper
+        # Watch parent resize events
+        self.parent.installEventFilter(self)
 
         QTimer.singleShot(1, self.first_size)
 
@@ -348,11 +360,11 @@ class _OverlayWidget(QtWidgets.QWidget):
         height = self.parent.frameGeometry().height() - self.header_height
         self.setGeometry(0, 0, self.parent.frameGeometry().width(), height)
 
-    def _parent_resize_wrapper(self, event):
-        self.org_parent_resize_event(event)
-        self.resize(self.parent.size())
+    def eventFilter(self, obj, event):
+        if obj is self.parent and event.type() == QEvent.Resize:
+            self.resize(self.parent.size())
 
-        event.accept()
+        return False
 
     def move_to_center(self, current_mov):
         """ Move Screen to center """
@@ -383,15 +395,7 @@ class _OverlayWidget(QtWidgets.QWidget):
         self._updateParent()
 
     def _updateParent(self):
-        """ Resize self and update parent widget """
-        original = self.parent.resizeEvent
-
-        def resizeEventWrapper(event):
-            original(event)
-            self.resize(event.size())
-
-        resizeEventWrapper._original = original
-        self.parent.resizeEvent = resizeEventWrapper
+        """ Resize self to parent widget, further resizes are handled by the event filter """
         self.resize(self.parent.size())
 
 
@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Dict
 
 from PySide2.QtCore import QFile, QIODevice, QByteArray
 from PySide2.QtGui import QFont, QFontDatabase, QIcon, QPixmap
@@ -19,9 +20,9 @@ _ = lang.gettext
 
 class IconRsc:
     # Store loaded icons here
-    icon_storage = {
-        'example_key': QIcon()
-        }
+    icon_storage: Dict[str, QIcon] = dict()
+    # Store loaded pixmaps here
+    pixmap_storage: Dict[str, QPixmap] = dict()
     # Style Setting
     darkstyle = False
 
@@ -61,7 +62,10 @@ class IconRsc:
         if icon_key not in Resource.icon_paths.keys():
             return QPixmap()
 
-        return QPixmap(Resource.icon_paths[icon_key])
+        if icon_key not in cls.pixmap_storage.keys():
+            cls.pixmap_storage[icon_key] = QPixmap(Resource.icon_paths[icon_key])
+
+        return cls.pixmap_storage[icon_key]
 
     @classmethod
     def get_icon(cls, icon_key: str):
@@ -139,9 +143,7 @@ class IconRsc:
 
 
 class FontRsc:
-    font_storage = {
-        'example_key': None
-        }
+    font_storage: Dict[str, int] = dict()
 
     regular = None
     italic = None
@@ -1,3 +1,4 @@
+import logging
 from pathlib import Path
 from typing import List
 
@@ -17,7 +18,6 @@ LOGGER = init_logging(__name__)
 
 # translate strings
 lang = get_translation()
-lang.install()
 _ = lang.gettext
 
 
@@ -26,6 +26,9 @@ class UiViewManager(ViewManager):
     close_clip_txt = _('Die Zwischenablage enthält <i>{}</i> Elemente aus<br><i>{}</i><br><br>'
                        'Diese werden durch Schließen des Dokumentes aus der Zwischenablage <b>entfernt</b>.')
     close_clip_ok = _('Schließen')
+    new_document_name = _('Neues_Dokument.xml')
+    reject_tab_remove_txt = _('Kann Beschäftigten nicht entlassen. '
+                              'Verstoß gegen Arbeitnehmerschutzgesetz festgestellt.')
 
     def __init__(self, ui):
         self.ui = ui
@@ -43,7 +46,7 @@ class UiViewManager(ViewManager):
 
     def setup_initial_tab_view(self, initial_tree_view):
         new_view = self.replace_tree_view(initial_tree_view)
-        file = Path(_('Neues_Dokument.xml'))
+        file = Path(self.new_document_name)
         self.setup_tree_view(new_view, file=file, filter_widget=self.filter_widget)
 
         # Setup initial tab widget view attribute
@@ -56,11 +59,9 @@ class UiViewManager(ViewManager):
     def setup_default_views(self, tree_view_list: List[KnechtTreeView], tree_file_list: List[Path],
                             tree_filter_widgets: List[QLineEdit]):
         """ initial tree view setup on application start """
-        new_views = list()
-        for idx, (tree_view, file, filter_widget) in enumerate(zip(
-                tree_view_list, tree_file_list, tree_filter_widgets)):
-            new_view = self.replace_tree_view(tree_view)
-            new_views.append(new_view)
+        new_views = [self.replace_tree_view(tree_view) for tree_view in tree_view_list]
+
+        for new_view, file, filter_widget in zip(new_views, tree_file_list, tree_filter_widgets):
             self.setup_tree_view(new_view, file=Path(file), filter_widget=filter_widget)
 
         # Reset focus to default tab.
@@ -87,8 +88,9 @@ class UiViewManager(ViewManager):
             Document inside tab widget was saved, set TreeView undostack clean
             and update file_mgr if necessary
         """
+        tab = self.tab
         current_view = self.current_view()
-        current_widget = self.tab.currentWidget()
+        current_widget = tab.currentWidget()
 
         # Update File Manager
         if file != self.file_mgr.get_file_from_widget(current_widget):
@@ -97,7 +99,7 @@ class UiViewManager(ViewManager):
             self.file_update.emit(file, current_widget, True)
             current_view.setObjectName(file.name)
 
-        self.update_tab_title(self.tab.currentIndex(), file)
+        self.update_tab_title(tab.currentIndex(), file)
         current_view.undo_stack.setClean()
 
     def additional_tree_setup(self, tree_view: KnechtTreeView):
@@ -123,10 +125,11 @@ class UiViewManager(ViewManager):
 
     @Slot(KnechtTreeView)
     def remove_view(self, view: KnechtTreeView):
+        undo_stack = view.undo_stack
         self.clear_render_presets(view)
 
         # Remove undo stack
-        self.app.undo_grp.removeStack(view.undo_stack)
+        self.app.undo_grp.removeStack(undo_stack)
 
         # Update view focus as soon as view is actually destroyed
         view.destroyed.connect(self.tree_about_to_be_destroyed)
@@ -138,17 +141,20 @@ class UiViewManager(ViewManager):
         view.undo_stack.setActive(True)
 
     def reject_tab_remove(self):
-        self.ui.msg(_('Kann Beschäftigten nicht entlassen. '
-                      'Verstoß gegen Arbeitnehmerschutzgesetz festgestellt.'), 10000)
+        self.ui.msg(self.reject_tab_remove_txt, 10000)
         LOGGER.info('Close of tab with busy tree view rejected.')
 
     def tree_about_to_be_destroyed(self, obj):
-        LOGGER.debug('Tree View %s is about to be destroyed and requests another view to gain focus.', obj.objectName())
+        log_debug = LOGGER.isEnabledFor(logging.DEBUG)
+        if log_debug:
+            LOGGER.debug('Tree View %s is about to be destroyed and requests another view to gain focus.',
+                         obj.objectName())
 
         if obj is not self.current_view():
             current_view = self.current_view()
             self.ui.set_last_focus_tree(current_view)
-            LOGGER.debug('Successfully set %s as new focus view.', current_view.objectName())
+            if log_debug:
+                LOGGER.debug('Successfully set %s as new focus view.', current_view.objectName())
         else:
             LOGGER.critical('Could not focus a view that is not about to be destroyed. Panic!!!')
             LOGGER.critical('Any follow up calls to menu actions will crash PySide2.')
@@ -172,6 +178,11 @@ class UiViewManager(ViewManager):
         if self.ui.clipboard.origin is not tab_view:
             return True
 
+        # Nothing to discard, release the origin reference without asking
+        if not self.ui.clipboard.items:
+            self.ui.clipboard.clear()
+            return True
+
         msg_box = AskToContinue(self.ui)
         self.ui.play_hint_sound()
 
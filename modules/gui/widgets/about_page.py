@@ -11,7 +11,6 @@ LOGGER = init_logging(__name__)
 
 # translate strings
 lang = get_translation()
-lang.install()
 _ = lang.gettext
 
 
@@ -60,44 +59,48 @@ class InfoMessage:
                      "Flaticon Basic License": "http://www.flaticon.com/",
                      "Apache License 2.0": "http://www.apache.org/licenses/",}
 
+    # Rendered info message, built on first request
+    _cached_info = None
+
     @classmethod
     def get(cls):
+        if cls._cached_info is not None:
+            return cls._cached_info
+
         if FROZEN:
             cls.ENV = 'Running frozen in bundled interpreter.'
         else:
             cls.ENV = 'Running unfrozen in IDE.'
 
-        info_msg = ['<b>RenderKnecht</b> v{version} licensed under {license}'
-                    .format(version=cls.ver, license=cls.lic),
-                    '(c) Copyright 2017-2019 {author}<br>'
-                    '<a href="mailto:{mail}" style="color: #363636">{mail}</a>'
-                    '<p style="font-family: Inconsolata;vertcial-align: middle;margin: 20px 0px 28px 0px">'
-                    '<a href="https://github.com/tappi287/RenderKnecht2" style="color: #363636">'
-                    '<img src=":/main/social-github.png" width="24" height="24" '
-                    'style="float: left;vertical-align: middle;">'
-                    'Visit RenderKnecht source on Github</a>'
-                    '<br>{system}; {env}'
-                    '</p>'
-                    '<h4>Credits:</h4><b>{credits}</b>'
-                    '<h4>Resource Credits:</h4>{icon_credits}'
-                    '<h4>Information:</h4>'
-                    '<p style="font-size: 10pt;"><i>{gnu}</i></p><br>'
-                    .format(author=cls.auth,
-                            mail=cls.mail,
-                            credits=cls.credit_list(),
-                            system=cls.START_INFO,
-                            icon_credits=cls.resource_credits(),
-                            status=cls.stat,
-                            env=cls.ENV,
-                            gnu=GNU_MESSAGE)]
-
+        credits = cls.credit_list()
+        icon_credits = cls.resource_credits()
+
+        info_msg = [f'<b>RenderKnecht</b> v{cls.ver} licensed under {cls.lic}',
+                    f'(c) Copyright 2017-2019 {cls.auth}<br>'
+                    f'<a href="mailto:{cls.mail}" style="color: #363636">{cls.mail}</a>'
+                    f'<p style="font-family: Inconsolata;vertcial-align: middle;margin: 20px 0px 28px 0px">'
+                    f'<a href="https://github.com/tappi287/RenderKnecht2" style="color: #363636">'
+                    f'<img src=":/main/social-github.png" width="24" height="24" '
+                    f'style="float: left;vertical-align: middle;">'
+                    f'Visit RenderKnecht source on Github</a>'
+                    f'<br>{cls.START_INFO}; {cls.ENV}'
+                    f'</p>'
+                    f'<h4>Credits:</h4><b>{credits}</b>'
+                    f'<h4>Resource Credits:</h4>{icon_credits}'
+                    f'<h4>Information:</h4>'
+                    f'<p style="font-size: 10pt;"><i>{GNU_MESSAGE}</i></p><br>']
+
+        cls._cached_info = info_msg
         return info_msg
 
+    @classmethod
+    def invalidate(cls):
+        """ Clear the rendered info message, needs to be called if class attributes are changed after first use """
+        cls._cached_info = None
+
     @classmethod
     def credit_list(cls):
-        html_lines = ''
-        for line in cls.cred:
-            html_lines += f'<li>{line}</li>'
+        html_lines = ''.join([f'<li>{line}</li>' for line in cls.cred])
 
         return f'<ul style="list-style-type: none;">{html_lines}</ul>'
 
@@ -105,44 +108,41 @@ class InfoMessage:
     def resource_credits(cls):
         icon_credits = cls.icon_credits
         license_links = cls.license_links
-        html_lines = ''
 
         # Add icon credits
-        for line in icon_credits:
-            icon_path, name, author, author_link, lic = line
-            # f'<img src="{icon_path}" width="18" height="18" style="float: left;">' \
-
-            html_lines += f'<li>' \
-                          f'<span style="font-size: 10pt;">' \
-                          f'<img src="{icon_path}" width="24" height="24" ' \
-                          f'style="vertical-align: baseline; display: inline"> ' \
-                          f'"{name}" <b><a style="color: #363636" href="{author_link}">{author}</a></b> ' \
-                          f'licensed under <a style="color: #363636" href="{license_links[lic]}">{lic}</a>' \
-                          f'</span>' \
-                          f'</li>'
+        html_lines = [f'<li>'
+                      f'<span style="font-size: 10pt;">'
+                      f'<img src="{icon_path}" width="24" height="24" '
+                      f'style="vertical-align: baseline; display: inline"> '
+                      f'"{name}" <b><a style="color: #363636" href="{author_link}">{author}</a></b> '
+                      f'licensed under <a style="color: #363636" href="{license_links[lic]}">{lic}</a>'
+                      f'</span>'
+                      f'</li>'
+                      for icon_path, name, author, author_link, lic in icon_credits]
 
         # Add font credit line
-        html_lines += '<li style="line-height: 28px; font-family: Inconsolata"><span style="font-size: 10pt;">' \
-                      'Inconsolata Font by ' \
-                      '<b><a href="http://levien.com/type/myfonts/inconsolata.html" style="color: #363636">' \
-                      'Raph Levien</a></b> ' \
-                      '<a style="color: #363636" href="http://scripts.sil.org/OFL">' \
-                      'SIL Open Font License, Version 1.1</a>' \
-                      '</span></li>'
+        html_lines.append('<li style="line-height: 28px; font-family: Inconsolata"><span style="font-size: 10pt;">'
+                          'Inconsolata Font by '
+                          '<b><a href="http://levien.com/type/myfonts/inconsolata.html" style="color: #363636">'
+                          'Raph Levien</a></b> '
+                          '<a style="color: #363636" href="http://scripts.sil.org/OFL">'
+                          'SIL Open Font License, Version 1.1</a>'
+                          '</span></li>')
 
         # Add Source Sans Pro font credit line
-        html_lines += '<li style="line-height: 28px;"><span style="font-size: 10pt;">' \
-                      'Source Sans Pro Font by ' \
-                      '<b><a href="https://fonts.google.com/specimen/Source+Sans+Pro" style="color: #363636">' \
-                      'Paul D. Hunt</a></b> ' \
-                      '<a style="color: #363636" href="http://scripts.sil.org/OFL">' \
-                      'SIL Open Font License, Version 1.1</a>' \
-                      '</span></li>'
+        html_lines.append('<li style="line-height: 28px;"><span style="font-size: 10pt;">'
+                          'Source Sans Pro Font by '
+                          '<b><a href="https://fonts.google.com/specimen/Source+Sans+Pro" style="color: #363636">'
+                          'Paul D. Hunt</a></b> '
+                          '<a style="color: #363636" href="http://scripts.sil.org/OFL">'
+                          'SIL Open Font License, Version 1.1</a>'
+                          '</span></li>')
 
-        return f'<ul style="list-style-type: none;">{html_lines}</ul>'
+        return f'<ul style="list-style-type: none;">{"".join(html_lines)}</ul>'
 
 
 class KnechtAbout(QWidget):
+    window_title = 'Info'
 
     def __init__(self, ui):
         """ Generic welcome page
@@ -152,10 +152,19 @@ class KnechtAbout(QWidget):
         super(KnechtAbout, self).__init__()
         SetupWidget.from_ui_file(self, Resource.ui_paths['knecht_about'])
         self.ui = ui
-        self.setWindowTitle(('Info'))
+        self.setWindowTitle(self.window_title)
 
         self.title_label.setText('RenderKnecht v{}'.format(InfoMessage.ver))
-        self.update_about_text()
+
+        # About text will be set on first show event
+        self._about_text_set = False
+
+    def showEvent(self, event):
+        if not self._about_text_set:
+            self.update_about_text()
+            self._about_text_set = True
+
+        super(KnechtAbout, self).showEvent(event)
 
     def update_about_text(self):
         msg = InfoMessage.get()
@@ -9,7 +9,6 @@ LOGGER = init_logging(__name__)
 
 # translate strings
 lang = get_translation()
-lang.install()
 _ = lang.gettext
 
 
@@ -26,11 +25,19 @@ class QColorButton(QPushButton):
     bg_style = 'background-color: rgb(230, 230, 230);'
     border_style = 'border: 1px solid rgb(0, 0, 0);'
 
+    # Stylesheet templates, color style expects the color name
+    color_style_tmpl = f'{style_id} {{background-color: %s; {border_style}}}'
+    none_style = f'{style_id} {{{bg_style} {border_style}}}'
+
+    # Color set on init and right click reset
+    default_color = QColor(255, 255, 255, 255)
+
     def __init__(self, *args, **kwargs):
         super(QColorButton, self).__init__(*args, **kwargs)
 
         self._color = None
-        self.set_color(QColor(255, 255, 255, 255))
+        self._style = None
+        self.set_color(QColor(self.default_color))
 
         self.setMaximumWidth(32)
         self.pressed.connect(self.on_color_picker)
@@ -40,17 +47,22 @@ class QColorButton(QPushButton):
         self.set_color(q_color)
 
     def set_color(self, color: QColor):
+        if self._color is not None and color == self._color:
+            return
+
         self._color = color
         self.colorChanged.emit(color)
 
         if self._color:
-            style = "{!s} {{background-color: {!s}; {!s}}}".format(
-                     self.style_id, self._color.name(), self.border_style)
+            style = self.color_style_tmpl % self._color.name()
         else:
-            style = "QPushButton#pushButton_Bgr {{{!s} {!s}}}".format(
-                     self.style_id, self.bg_style, self.border_style)
+            style = self.none_style
+
+        # Colors differing only in alpha result in the same stylesheet
+        if style == self._style:
+            return
 
-        LOGGER.debug('Setting Style: %s', style)
+        self._style = style
         self.setStyleSheet(style)
 
     def color(self):
@@ -79,7 +91,7 @@ class QColorButton(QPushButton):
 
     def mousePressEvent(self, e):
         if e.button() == Qt.RightButton:
-            self.set_color(QColor(255, 255, 255, 255))
+            self.set_color(QColor(self.default_color))
             e.accept()
 
         return super(QColorButton, self).mousePressEvent(e)
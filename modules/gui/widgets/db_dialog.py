@@ -1,7 +1,7 @@
 import datetime
 from pathlib import Path
 
-from PySide2.QtCore import QTimer, Qt, Signal, Slot
+from PySide2.QtCore import QEvent, QTimer, Qt, Signal, Slot
 from PySide2.QtGui import QMouseEvent
 from PySide2.QtWidgets import QDialog, QLabel, QPushButton, QLineEdit
 
@@ -27,6 +27,20 @@ lang = get_translation()
 lang.install()
 _ = lang.gettext
 
+_PROJECT_HEADER = ('', _('Bezeichnung'), _('Modelljahr'), _('Job'), '', _('Id'))
+_IMAGE_HEADER = ('', _('Name'), _('Priorität'), _('Erstellt'), '', _('wagenbauteil Id'))
+_LANG_REQUEST_DATA = _('Daten werden angefordert')
+_LANG_SELECT_PROJECT = _('Projekt auswählen')
+
+_SPACE_TO_UNDERSCORE = str.maketrans(' ', '_')
+
+# Pre-formatted order column strings
+_IDX3 = tuple(f'{i:03d}' for i in range(1024))
+
+
+def _order_str(num_idx: int) -> str:
+    return _IDX3[num_idx] if num_idx < 1024 else f'{num_idx:03d}'
+
 
 class DatapoolDialog(QDialog):
     finished = Signal(KnechtModel, Path)
@@ -35,6 +49,18 @@ class DatapoolDialog(QDialog):
     # Close connection after 10 minutes of user inactivity
     timeout = 600000
 
+    # Ignore project clicks for this long after a click and after image data arrived
+    action_interval = 400
+    action_tail_interval = 100
+
+    # Re-filter only after the user paused typing
+    filter_interval = 250
+
+    # (column, hidden) pairs for the simple and detailed column layout
+    _cols = (Kg.ORDER, Kg.NAME, Kg.VALUE, Kg.TYPE, Kg.REF, Kg.ID, Kg.DESC)
+    _cols_detailed = tuple((col, col not in {Kg.NAME, Kg.VALUE, Kg.TYPE, Kg.ID}) for col in _cols)
+    _cols_simple = tuple((col, col != Kg.NAME) for col in _cols)
+
     def __init__(self, ui):
         """ Dialog to import Datapool items
 
@@ -46,12 +72,16 @@ class DatapoolDialog(QDialog):
 
         self._asked_for_close = False
         self._current_project_name = ''
+
+        # Last data transmitted to the views, identical payloads will not rebuild the view models
+        self._last_projects = dict()
+        self._last_images = dict()
         self.ui = ui
 
         # Avoid db/thread polling within timeout
         self.action_timeout = QTimer()
         self.action_timeout.setSingleShot(True)
-        self.action_timeout.setInterval(300)
+        self.action_timeout.setInterval(self.action_interval)
 
         # --- Translations n Style ---
         self.project_icon: QLabel
@@ -70,18 +100,26 @@ class DatapoolDialog(QDialog):
 
         # -- Trigger filter update for all views ---
         self.update_filter_timer = QTimer()
-        self.update_filter_timer.setInterval(5)
+        self.update_filter_timer.setInterval(self.filter_interval)
         self.update_filter_timer.setSingleShot(True)
         self.update_filter_timer.timeout.connect(self.update_filter_all_views)
-
-        self.filter_box: QLineEdit
         self.filter_box.textChanged.connect(self.update_filter_timer.start)
 
+        # Last filter text applied to the image view
+        self._last_filter_text = None
+
+        # -- Coalesce header layout updates of successive column toggles ---
+        self._header_refresh_timer = QTimer()
+        self._header_refresh_timer.setInterval(0)
+        self._header_refresh_timer.setSingleShot(True)
+        self._header_refresh_timer.timeout.connect(self._setup_view_headers)
+
         # --- Init Tree Views ---
         self.project_view = KnechtTreeViewCheckable(self, None, filter_widget=self.filter_box,
                                                     replace=self.project_view)
         self.image_view = KnechtTreeViewCheckable(self, None, filter_widget=self.filter_box,
                                                   replace=self.image_view)
+        self.image_view.filter_timer.setInterval(self.filter_interval)
 
         # --- Database Connector ---
         self.dp = DatapoolController(self)
@@ -98,33 +136,52 @@ class DatapoolDialog(QDialog):
         # Make sure to end thread on App close
         self.ui.is_about_to_quit.connect(self.close)
 
-        # Intercept mouse press events from project view
-        self.org_view_mouse_press_event = self.project_view.mousePressEvent
-        self.project_view.mousePressEvent = self.view_mouse_press_event
+        # Intercept mouse press events from project view, mouse events are delivered to the viewport
+        self.project_view.viewport().installEventFilter(self)
 
         # Start thread
         QTimer.singleShot(100, self.start_datapool_connection)
 
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.MouseButtonPress and obj == self.project_view.viewport():
+            self.view_mouse_press_event(event)
+
+        # Let the view process the event
+        return False
+
     def view_mouse_press_event(self, event: QMouseEvent):
         if event.buttons() == Qt.LeftButton and not self.action_timeout.isActive():
-            idx = self.project_view.indexAt(event.pos())
-            name = idx.siblingAtColumn(Kg.NAME).data(Qt.DisplayRole)
+            item = self.project_view.item_at(self.project_view.indexAt(event.pos()))
+            if item is None:
+                return
+
+            name = item.data(Kg.NAME)
             self._current_project_name = name
-            _id = idx.siblingAtColumn(Kg.ID).data(Qt.DisplayRole)
+            _id = item.data(Kg.ID)
             LOGGER.debug('Project %s Id %s selected', name, _id)
-            self.action_timeout.start()
+            self.action_timeout.start(self.action_interval)
 
             if _id:
                 self.request_project(_id)
 
-        self.org_view_mouse_press_event(event)
+    def hideEvent(self, event):
+        # Do not filter views that are not visible
+        self.update_filter_timer.stop()
+
+        super(DatapoolDialog, self).hideEvent(event)
 
     def update_filter_all_views(self):
         # Do not filter project view
         self.project_view.filter_timer.stop()
 
+        # Skip re-filtering the image view with an identical text
+        txt = self.filter_box.text()
+        if txt == self._last_filter_text:
+            return
+        self._last_filter_text = txt
+
         # Update image view filter
-        if not self.filter_box.text():
+        if not txt:
             self.image_view.clear_filter()
         else:
             self.image_view.filter_timer.start()
@@ -140,13 +197,17 @@ class DatapoolDialog(QDialog):
         if not projects:
             return
 
-        root_item = KnechtItem(None, ('', _('Bezeichnung'), _('Modelljahr'), _('Job'), '', _('Id')))
+        if projects == self._last_projects:
+            self.project_view.progress_msg.hide_progress()
+            return
+        self._last_projects = dict(projects)
 
-        for num_idx, (_id, project_data) in enumerate(projects.items()):
-            data = (f'{num_idx:03d}', *project_data, '', str(_id))
-            p_item = KnechtItem(root_item, data)
-            KnechtItemStyle.style_column(p_item, 'render_preset', column=Kg.NAME)
-            root_item.append_item_child(p_item)
+        root_item = KnechtItem(None, _PROJECT_HEADER)
+
+        data_rows = [(_order_str(num_idx), *project_data, '', str(_id))
+                     for num_idx, (_id, project_data) in enumerate(projects.items())]
+        root_item.insertChildren(0, len(data_rows), *data_rows)
+        KnechtItemStyle.style_children_column(root_item, 'render_preset', column=Kg.NAME)
 
         update_model = UpdateModel(self.project_view)
         update_model.update(KnechtModel(root_item))
@@ -156,7 +217,8 @@ class DatapoolDialog(QDialog):
 
     def request_project(self, _id: str):
         self.image_view.clear_filter()
-        self.image_view.progress_msg.msg(_('Daten werden angefordert'))
+        self._last_filter_text = None
+        self.image_view.progress_msg.msg(_LANG_REQUEST_DATA)
         self.image_view.progress_msg.show_progress()
 
         self.dp.request_project(_id)
@@ -164,54 +226,74 @@ class DatapoolDialog(QDialog):
 
     @Slot(dict)
     def update_image_view(self, images: dict):
+        # Swallow clicks queued while the view is being rebuilt, only ever extend a running guard
+        if not self.action_timeout.isActive() or self.action_timeout.remainingTime() < self.action_tail_interval:
+            self.action_timeout.start(self.action_tail_interval)
+
         if not images:
             return
 
-        root_item = KnechtItem(None, ('', _('Name'), _('Priorität'), _('Erstellt'), '', _('wagenbauteil Id')))
+        if images == self._last_images:
+            # Same project re-requested, keep the current model with its check states, selection and scroll position
+            self.image_view.progress_msg.hide_progress()
+            return
+        self._last_images = dict(images)
+
+        root_item = KnechtItem(None, _IMAGE_HEADER)
 
+        data_rows = list()
         for num_idx, (img_id, image_data) in enumerate(images.items()):
             """ (name, priority, created, pr_string, opt_id, produced_image_id) """
             name, priority, created, pr_string, opt_id, produced_image_id = image_data
-            img_item = KnechtItem(root_item, (f'{num_idx:03d}', name, priority, created, '', str(opt_id)))
-            KnechtItemStyle.style_column(img_item, 'preset', Kg.NAME)
-            root_item.append_item_child(img_item)
+            data_rows.append((_order_str(num_idx), name, priority, created, '', str(opt_id)))
+        root_item.insertChildren(0, len(data_rows), *data_rows)
+        KnechtItemStyle.style_children_column(root_item, 'preset', Kg.NAME)
+
+        # Check all images before the model is created instead of setting model data row by row
+        for img_item in root_item.iter_children():
+            img_item.setChecked(self.check_column, Qt.Checked)
 
         update_model = UpdateModel(self.image_view)
         update_model.update(KnechtModel(root_item, checkable_columns=[self.check_column]))
+        # The new model is not filtered yet
+        self._last_filter_text = None
 
         self.toggle_view_columns(self.details_btn.isChecked())
         self.image_view.setHeaderHidden(False)
-        self.image_view.check_items([], Kg.NAME, check_all=True)
 
     def create_presets(self):
-        root_item = KnechtItem()
+        # Only export visible rows, rows hidden by the filter map to invalid source indices
+        checked_items = [item for src_index, item in self.image_view.editor.iterator.iterate_view()
+                         if src_index.isValid() and item.isChecked(self.check_column)]
 
-        for (src_index, item) in self.image_view.editor.iterator.iterate_view():
-            if item.data(self.check_column, Qt.CheckStateRole) == Qt.Unchecked:
-                continue
+        data_rows = [(_order_str(num_idx), item.data(Kg.NAME), '', 'preset', '', Kid.create_id())
+                     for num_idx, item in enumerate(checked_items)]
 
-            name = item.data(Kg.NAME)
-            data = (f'{root_item.childCount():03d}', name, '', 'preset', '',
-                    Kid.convert_id(f'{root_item.childCount()}'))
-            root_item.insertChildren(root_item.childCount(), 1, data)
+        root_item = KnechtItem()
+        root_item.insertChildren(0, len(data_rows), *data_rows)
 
         date = datetime.datetime.now().strftime('%Y%m%d')
-        project = self._current_project_name.replace(' ', '_')
+        project = self._current_project_name.translate(_SPACE_TO_UNDERSCORE)
         self.finished.emit(KnechtModel(root_item), Path(f'{date}_{project}.xml'))
 
     def toggle_view_columns(self, checked: bool):
-        columns = {Kg.ORDER, Kg.NAME, Kg.VALUE, Kg.TYPE, Kg.REF, Kg.ID, Kg.DESC}
+        column_layout = self._cols_detailed if checked else self._cols_simple
 
-        if checked:
-            show_columns = {Kg.NAME, Kg.VALUE, Kg.TYPE, Kg.ID}
-        else:
-            show_columns = {Kg.NAME}
+        views = (self.project_view, self.image_view)
+
+        # Repaint both views once after all columns of both views changed
+        for view in views:
+            view.setUpdatesEnabled(False)
 
-        for col in columns:
-            self.project_view.setColumnHidden(col, col not in show_columns)
-            self.image_view.setColumnHidden(col, col not in show_columns)
+        for col, hidden in column_layout:
+            for view in views:
+                if view.isColumnHidden(col) != hidden:
+                    view.setColumnHidden(col, hidden)
 
-        self._setup_view_headers()
+        for view in views:
+            view.setUpdatesEnabled(True)
+
+        self._header_refresh_timer.start()
 
     def _setup_view_headers(self):
         setup_header_layout(self.project_view)
@@ -229,7 +311,7 @@ class DatapoolDialog(QDialog):
         self.project_view.progress_msg.msg(msg)
         self.project_view.progress_msg.show_progress()
 
-        self.image_view.progress_msg.msg(_('Projekt auswählen'))
+        self.image_view.progress_msg.msg(_LANG_SELECT_PROJECT)
         self.image_view.progress_msg.show_progress()
         self.image_view.progress_msg.progressBar.setValue(0)
 
@@ -255,9 +337,7 @@ class DatapoolDialog(QDialog):
 
         LOGGER.info('Datapool window close event triggered. Aborting database connection')
         # End thread
-        if not self._finalize_dialog():
-            close_event.ignore()
-            return False
+        self._finalize_dialog()
 
         close_event.accept()
         return True
@@ -280,11 +360,9 @@ class DatapoolDialog(QDialog):
         # Close confirmed
         return False
 
-    def _finalize_dialog(self, self_destruct: bool=True) -> bool:
+    def _finalize_dialog(self, self_destruct: bool=True):
         LOGGER.debug('Datapool dialog is finishing tasks.')
-        if not self.dp.close():
-            return False
+        self.dp.close()
 
         if self_destruct:
             self.deleteLater()
-        return True
@@ -1,5 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from threading import Thread
+from threading import Event, Thread
+from typing import Dict, List, Tuple
 
 from PySide2.QtCore import QByteArray, QFile, QIODevice, QObject, QTimer, Qt, Signal, Slot
 from PySide2.QtWidgets import QCheckBox, QDialog, QGroupBox, QLabel, QLineEdit, QTabWidget
@@ -31,6 +33,32 @@ lang = get_translation()
 lang.install()
 _ = lang.gettext
 
+# Widget attribute name, setter method, setter arguments
+_EXCEL_DIALOG_TRANSLATIONS = (
+    # --- Options ---
+    ('option_box', 'setTitle', _('Optionen')),
+    ('check_read_trim', 'setText', _('Trimlines erstellen')),
+    ('check_read_options', 'setText', _('Optionen erstellen')),
+    ('check_read_packages', 'setText', _('Pakete erstellen')),
+    ('check_options_filter', 'setText', _('Optionen nach VPlus Wert filtern')),
+    ('check_options_filter', 'setStatusTip', _('Nur optionale PR-Optionen mit Wert E auslesen. Anderfalls alle '
+                                               'die nicht L entsprechen aus Vplus lesen.')),
+
+    # --- PR-Family filter ---
+    ('family_box', 'setTitle', _('PR-Familien Filter Vorlagen')),
+    ('btn_filter_all', 'setText', _('Alle PR-Familien')),
+    ('btn_filter_int', 'setText', _('Interieur I/VX-13')),
+    ('btn_filter_ext', 'setText', _('Exterieur I/VX-13')),
+    ('check_pr_fam_filter_packages', 'setText', _('PR-Familien Filter auf Pakete anwenden')),
+
+    # --- Tree views ---
+    ('lineEdit_filter', 'setPlaceholderText', _('Zum filtern tippen ...')),
+    ('tabWidget_Excel', 'setTabText', 0, _('Modellfilter')),
+    ('tabWidget_Excel', 'setTabText', 1, _('PR-Familien-Filter')),
+    ('label', 'setText', _('PR Familien auswählen die ausgelesen werden sollen.')),
+    ('label_Models', 'setText', _('Modelle auswählen die ausgelesen werden sollen.')),
+    )
+
 
 class ExcelImportDialog(QDialog):
     finished = Signal(QDialog)
@@ -42,10 +70,9 @@ class ExcelImportDialog(QDialog):
         progress_msg = Signal(str)
         exception_sig = Signal(object)
 
-    pr_root_item = KnechtItem(data=(
-        '', _('PR-Familie'), _('Beschreibung'),))
-    models_root_item = KnechtItem(data=(
-        '', _('Model'), _('Markt'), _('Beschreibung'), '', '', _('Getriebe')))
+    # Header data of the tree view root items
+    pr_header = ('', _('PR-Familie'), _('Beschreibung'),)
+    models_header = ('', _('Model'), _('Markt'), _('Beschreibung'), '', '', _('Getriebe'))
 
     class PrColumn:
         code = 1
@@ -58,9 +85,9 @@ class ExcelImportDialog(QDialog):
         gearbox = 6
 
     class PrDefaultFilter:
-        """ Filter will be populated from resource data """
-        interior = list()
-        exterior = list()
+        """ Filter will be populated from resource data and stored as frozensets """
+        interior = frozenset()
+        exterior = frozenset()
 
     def __init__(self, ui, file: Path, pos_file: Path=None, fixed_options: bool=False):
         """ Dialog to set Excel V Plus import options
@@ -76,6 +103,7 @@ class ExcelImportDialog(QDialog):
         # --- Attributes ---
         self.ui = ui
         self.file = file
+        self._file_posix = file.as_posix()
         self.data: KnData = None
         self.selected_models = list()
         self.selected_pr_families = list()
@@ -84,6 +112,8 @@ class ExcelImportDialog(QDialog):
         self._settings_loaded = False
         self._abort = False
         self._data_ready_count = 0
+        # Cached top level items per tree view
+        self._view_items: Dict[KnechtTreeView, List[KnechtItem]] = dict()
 
         # --- Read Fakom if pos file provided ---
         self.read_fakom = False
@@ -94,9 +124,15 @@ class ExcelImportDialog(QDialog):
         self.fixed_options = fixed_options
 
         # --- Filter Buttons ---
+        # Coalesce quickly toggled filter buttons into one PR-Family view update
+        self.pr_update_timer = QTimer()
+        self.pr_update_timer.setSingleShot(True)
+        self.pr_update_timer.setInterval(40)
+        self.pr_update_timer.timeout.connect(self.update_pr_view)
+
         for a in (self.btn_filter_all, self.btn_filter_ext, self.btn_filter_int):
             # Use released trigger so we do not trigger an update on settings load
-            a.released.connect(self.update_pr_view)
+            a.released.connect(self.pr_update_timer.start)
 
         # --- Clear filter on tab change ---
         self.tabWidget_Excel.currentChanged.connect(self._clear_tree_filter)
@@ -110,62 +146,63 @@ class ExcelImportDialog(QDialog):
 
         # --- Reader Thread ---
         thread_signals = self.ThreadSignals()
-        self.excel_thread = Thread(target=self.excel_load_thread, args=(thread_signals, self.file, pos_file))
+        self._abort_event = Event()
+        self.excel_thread = Thread(target=self.excel_load_thread,
+                                   args=(thread_signals, self.file, pos_file, self._abort_event))
         thread_signals.finished.connect(self.read_finished)
         thread_signals.error.connect(self.read_failed)
         thread_signals.exception_sig.connect(self._thread_exception)
         thread_signals.progress_msg.connect(self.show_progress)
 
+        # Poll the aborted reader thread and destroy the dialog once it returned
+        self.finalize_timer = QTimer()
+        self.finalize_timer.setInterval(50)
+        self.finalize_timer.timeout.connect(self._destruct_when_finished)
+
         # --- Abort thread if UI is closed ---
         self.ui.is_about_to_quit.connect(self._finalize_dialog)
 
         # --- Init Icons + Translations ---
         self.option_box: QGroupBox
-        self.option_box.setTitle(_('Optionen'))
         self.check_read_trim: QCheckBox
-        self.check_read_trim.setText(_('Trimlines erstellen'))
         self.check_read_trim.setIcon(IconRsc.get_icon('car'))
         self.check_read_options: QCheckBox
-        self.check_read_options.setText(_('Optionen erstellen'))
         self.check_read_options.setIcon(IconRsc.get_icon('options'))
         self.check_read_packages: QCheckBox
-        self.check_read_packages.setText(_('Pakete erstellen'))
         self.check_read_packages.setIcon(IconRsc.get_icon('pkg'))
         self.check_options_filter: QCheckBox
-        self.check_options_filter.setText(_('Optionen nach VPlus Wert filtern'))
         self.check_options_filter.setIcon(IconRsc.get_icon('sort'))
-        self.check_options_filter.setStatusTip(_('Nur optionale PR-Optionen mit Wert E auslesen. Anderfalls alle die '
-                                                 'nicht L entsprechen aus Vplus lesen.'))
 
         self.family_box: QGroupBox
-        self.family_box.setTitle(_('PR-Familien Filter Vorlagen'))
         self.family_box.setEnabled(False)
         self.btn_filter_all: QCheckBox
-        self.btn_filter_all.setText(_('Alle PR-Familien'))
         self.btn_filter_int: QCheckBox
-        self.btn_filter_int.setText(_('Interieur I/VX-13'))
         self.btn_filter_ext: QCheckBox
-        self.btn_filter_ext.setText(_('Exterieur I/VX-13'))
         self.check_pr_fam_filter_packages: QCheckBox
         self.check_pr_fam_filter_packages.setIcon(IconRsc.get_icon('pkg'))
-        self.check_pr_fam_filter_packages.setText(_('PR-Familien Filter auf Pakete anwenden'))
 
         self.lineEdit_filter: QLineEdit
-        self.lineEdit_filter.setPlaceholderText(_('Zum filtern tippen ...'))
 
         self.tabWidget_Excel: QTabWidget
-        self.tabWidget_Excel.setTabText(0, _('Modellfilter'))
         self.tabWidget_Excel.setTabIcon(0, IconRsc.get_icon('car'))
-        self.tabWidget_Excel.setTabText(1, _('PR-Familien-Filter'))
         self.tabWidget_Excel.setTabIcon(1, IconRsc.get_icon('options'))
 
         self.label: QLabel
-        self.label.setText(_('PR Familien auswählen die ausgelesen werden sollen.'))
         self.label_Models: QLabel
-        self.label_Models.setText(_('Modelle auswählen die ausgelesen werden sollen.'))
+
+        for widget_name, method_name, *args in _EXCEL_DIALOG_TRANSLATIONS:
+            getattr(getattr(self, widget_name), method_name)(*args)
 
         self.buttonBox.setEnabled(False)
 
+        # --- Check boxes stored in the import settings by their object name ---
+        self._settings_widgets = tuple(
+            (box.objectName(), box) for box in (
+                self.btn_filter_all, self.btn_filter_int, self.btn_filter_ext, self.check_pr_fam_filter_packages,
+                self.check_read_trim, self.check_read_options, self.check_read_packages, self.check_options_filter
+                )
+            )
+
         QTimer.singleShot(100, self._start_load)
 
     @Slot(object)
@@ -173,35 +210,51 @@ class ExcelImportDialog(QDialog):
         raise Exception(e)
 
     @staticmethod
-    def excel_load_thread(signals: ThreadSignals, file: Path, pos_file: Path=None):
-        """ The thread that loads the excel file """
+    def excel_load_thread(signals: ThreadSignals, file: Path, pos_file: Path=None, abort_event: Event=None):
+        """ The thread that loads the excel file, returns early once abort_event is set """
+        abort_event = abort_event or Event()
         LOGGER.debug('Excel file reader thread started: %s', file.name)
         signals.progress_msg.emit(_('Excel Datei wird gelesen...'))
 
         xl = ExcelReader()
         fakom_data, knecht_data = FakomData(), KnData()
         fakom_result, xl_result = True, False
+        fakom_future, fakom_errors = None, list()
 
         # -- Read Fakom data if pos file provided --
+        # Parse the POS Xml in parallel to the excel file, lxml releases the GIL while parsing
         if pos_file and path_exists(pos_file):
-            try:
-                fakom_data = FakomReader.read_pos_file(pos_file)
+            executor = ThreadPoolExecutor(max_workers=1)
+            fakom_future = executor.submit(ExcelImportDialog._read_pos_file, pos_file)
+            executor.shutdown(wait=False)
 
-                if fakom_data.empty():
-                    xl.errors.append(_('POS Xml enthält keine bekannten Farbkombinationsmuster.'))
-                    fakom_result = False
-            except Exception as e:
-                LOGGER.error(e)
-                xl.errors.append(_('Konnte POS Xml Daten nicht lesen oder verarbeiten.'))
-                fakom_result = False
+        # -- Load PR-Family filter before the dialog needs it --
+        ExcelImportDialog._load_default_pr_filter()
 
         # -- Read Excel file --
+        try:
+            # --- Create data from excel file ---
+            if abort_event.is_set():
+                return
+            xl_result = xl.read_file(file)
+        except Exception as e:
+            LOGGER.error(e)
+            xl_result = False
+
+        if fakom_future is not None:
+            fakom_data, fakom_errors = fakom_future.result()
+
+            if fakom_errors:
+                # Report the POS errors only, the excel data will not be used
+                fakom_result = False
+
         if fakom_result:
             try:
-                # --- Create data from excel file ---
-                xl_result = xl.read_file(file)
                 signals.progress_msg.emit(_('Daten werden konvertiert...'))
 
+                if abort_event.is_set():
+                    return
+
                 # --- Convert excel data to knecht data ---
                 converter = ExcelDataToKnechtData(xl.data)
                 knecht_data = converter.convert()
@@ -210,6 +263,9 @@ class ExcelImportDialog(QDialog):
                 LOGGER.error(e)
                 xl_result = False
 
+        if abort_event.is_set():
+            return
+
         # Transmit resulting data or report error
         if xl_result and fakom_result:
             signals.progress_msg.emit(_('Daten übertragen...'))
@@ -217,11 +273,29 @@ class ExcelImportDialog(QDialog):
 
             signals.finished.emit(knecht_data)
         else:
-            LOGGER.debug('Excel read failed: %s', xl.errors)
-            signals.error.emit(xl.errors)
+            errors = fakom_errors or xl.errors
+            LOGGER.debug('Excel read failed: %s', errors)
+            signals.error.emit(errors)
 
-    def _load_default_pr_filter(self):
-        if self.PrDefaultFilter.interior:
+    @staticmethod
+    def _read_pos_file(pos_file: Path) -> Tuple[FakomData, List[str]]:
+        """ Read fakom data from the POS Xml, returns the data and a list of errors """
+        try:
+            fakom_data = FakomReader.read_pos_file(pos_file)
+        except Exception as e:
+            LOGGER.error(e)
+            return FakomData(), [_('Konnte POS Xml Daten nicht lesen oder verarbeiten.')]
+
+        if fakom_data.empty():
+            return fakom_data, [_('POS Xml enthält keine bekannten Farbkombinationsmuster.')]
+
+        return fakom_data, list()
+
+    @staticmethod
+    def _load_default_pr_filter():
+        """ Load the PR-Family filter resource once, called from the reader thread """
+        pr_filter = ExcelImportDialog.PrDefaultFilter
+        if pr_filter.interior:
             # Filter already loaded
             return
 
@@ -230,7 +304,9 @@ class ExcelImportDialog(QDialog):
             f.open(QIODevice.ReadOnly)
             data: QByteArray = f.readAll()
             data: bytes = data.data()
-            Settings.load_json_from_bytes(self.PrDefaultFilter, data)
+            Settings.load_json_from_bytes(pr_filter, data)
+            pr_filter.interior = frozenset(pr_filter.interior)
+            pr_filter.exterior = frozenset(pr_filter.exterior)
         except Exception as e:
             LOGGER.error(e)
         finally:
@@ -250,8 +326,8 @@ class ExcelImportDialog(QDialog):
         if self._abort:
             return
 
-        txt = [x+'\n' for x in errors]
-        msg_box = GenericMsgBox(self, _('Excel Import Fehler'), ''.join(txt), icon_key='excel')
+        txt = '\n'.join(errors)
+        msg_box = GenericMsgBox(self, _('Excel Import Fehler'), txt, icon_key='excel')
         msg_box.exec_()
         self._asked_for_close = True
         self.close()
@@ -262,21 +338,18 @@ class ExcelImportDialog(QDialog):
             return
 
         self.data = data
-        models = self.models_root_item.copy()
-        pr_fam = self.pr_root_item.copy()
+        self._view_items.clear()
+        models = KnechtItem(data=self.models_header)
+        pr_fam = KnechtItem(data=self.pr_header)
 
         # Populate models tree
-        for idx, t in enumerate(self.data.models):
-            models.insertChildren(
-                models.childCount(), 1, (f'{idx:01d}', t.model, t.market, t.model_text, '', '', t.gearbox),
-                fixed_userType=Kg.dialog_item
-                )
+        model_rows = [(str(idx), t.model, t.market, t.model_text, '', '', t.gearbox)
+                      for idx, t in enumerate(self.data.models)]
+        models.insertChildren(models.childCount(), len(model_rows), *model_rows, fixed_userType=Kg.dialog_item)
+
         # Populate PR Family tree
-        for idx, p in enumerate(self.data.pr_families):
-            pr_fam.insertChildren(
-                pr_fam.childCount(), 1, (f'{idx:01d}', p.name, p.desc),
-                fixed_userType=Kg.dialog_item
-                )
+        pr_rows = [(str(idx), p.name, p.desc) for idx, p in enumerate(self.data.pr_families)]
+        pr_fam.insertChildren(pr_fam.childCount(), len(pr_rows), *pr_rows, fixed_userType=Kg.dialog_item)
 
         # Update View Models
         update_models = UpdateModel(self.treeView_Models)
@@ -301,43 +374,42 @@ class ExcelImportDialog(QDialog):
                 box.setEnabled(False)
 
         self._setup_header_width()
-        self._load_default_pr_filter()
         self.load_settings()
 
     def update_pr_view(self):
         pr_all, pr_int, pr_ext = self.btn_filter_all.isChecked(), self.btn_filter_int.isChecked(), \
                                  self.btn_filter_ext.isChecked()
-        pr_family_filter = list()
+        pr_family_filter = frozenset()
 
         LOGGER.debug('Updating PR-Family view, All:%s, Int:%s, Ext:%s', pr_all, pr_int, pr_ext)
         if pr_int:
-            pr_family_filter += self.PrDefaultFilter.interior
+            pr_family_filter |= self.PrDefaultFilter.interior
         if pr_ext:
-            pr_family_filter += self.PrDefaultFilter.exterior
+            pr_family_filter |= self.PrDefaultFilter.exterior
 
         self.treeView_PrFam.check_items(pr_family_filter, self.PrColumn.code, check_all=pr_all)
 
-    @staticmethod
-    def _iter_view(view: KnechtTreeView, column: int):
-        for (src_index, item) in view.editor.iterator.iterate_view(column=column):
-            yield src_index, item
+    def _snapshot_view(self, view: KnechtTreeView) -> List[KnechtItem]:
+        """ Top level items of the view source model, cached until new data is read """
+        if view not in self._view_items:
+            self._view_items[view] = list(view.model().sourceModel().root_item.iter_children())
+
+        return self._view_items[view]
 
     def load_settings(self) -> bool:
         if self._settings_loaded:
             return True
 
-        for entry in KnechtSettings.excel:
-            if entry.get('file') == self.file.as_posix():
-                LOGGER.debug('Loading import setting for %s', self.file.name)
-                break
-        else:
+        entry = KnechtSettings.excel.get(self._file_posix)
+        if entry is None:
             self.update_pr_view()
             return False
 
+        LOGGER.debug('Loading import setting for %s', self.file.name)
+
         # Restore filter settings
-        for box in [self.btn_filter_all, self.btn_filter_int, self.btn_filter_ext, self.check_pr_fam_filter_packages,
-                    self.check_read_trim, self.check_read_options, self.check_read_packages, self.check_options_filter]:
-            check_state = entry.get(box.objectName())
+        for box_name, box in self._settings_widgets:
+            check_state = entry.get(box_name)
 
             if check_state is not None:
                 if check_state == 2:
@@ -362,60 +434,49 @@ class ExcelImportDialog(QDialog):
         return True
 
     def save_settings(self):
-        settings = dict(file=self.file.as_posix())
-        settings['models'] = list()
-        settings['pr_families'] = list()
+        settings = dict(file=self._file_posix)
 
         # Reset filters
         self._clear_tree_filter()
 
         # Save filter setting
-        for box in [self.btn_filter_all, self.btn_filter_int, self.btn_filter_ext, self.check_pr_fam_filter_packages,
-                    self.check_read_trim, self.check_read_options, self.check_read_packages, self.check_options_filter]:
-            settings.update({box.objectName(): int(box.checkState())})
+        settings.update({box_name: int(box.checkState()) for box_name, box in self._settings_widgets})
         # Save model selection
-        for (src_index, item) in self._iter_view(self.treeView_Models, self.ModelColumn.code):
-            if item.isChecked(self.ModelColumn.code):
-                settings['models'].append(str(item.data(self.ModelColumn.code)))
+        col = self.ModelColumn.code
+        settings['models'] = [str(item.data(col)) for item in self._snapshot_view(self.treeView_Models)
+                              if item.isChecked(col)]
         # Save PR Family selection
-        for (src_index, item) in self._iter_view(self.treeView_PrFam, self.PrColumn.code):
-            if item.isChecked(self.PrColumn.code):
-                settings['pr_families'].append(str(item.data(self.PrColumn.code)))
+        col = self.PrColumn.code
+        settings['pr_families'] = [str(item.data(col)) for item in self._snapshot_view(self.treeView_PrFam)
+                                   if item.isChecked(col)]
 
         # Update attributes for outside access
         self.selected_models = settings.get('models')
         self.selected_pr_families = settings.get('pr_families')
 
-        # Remove existing entry for this file
-        for entry in KnechtSettings.excel:
-            if entry.get('file') == self.file.as_posix():
-                KnechtSettings.excel.remove(entry)
-
-        # Prepend setting entry
-        KnechtSettings.excel.insert(0, settings)
+        # Store as most recent entry, only the last 5 files are kept
+        KnechtSettings.add_excel_settings(self._file_posix, settings)
+        KnechtSettings.add_recent_file(self._file_posix, 'xlsx')
 
-        # Only keep the last 5 number of items
-        if len(KnechtSettings.excel) > 5:
-            KnechtSettings.excel = KnechtSettings.excel[:5]
-
-        KnechtSettings.add_recent_file(self.file.as_posix(), 'xlsx')
-
-        LOGGER.debug('Saved: %s', KnechtSettings.excel[0])
+        LOGGER.debug('Saved: %s', settings)
 
     def _setup_header_width(self):
-        setup_header_layout(self.treeView_Models)
-        setup_header_layout(self.treeView_PrFam)
-        self.treeView_Models.header().resizeSection(1, 120)
-        self.treeView_PrFam.header().resizeSection(1, 110)
+        # Resize all sections without repainting the views in between
+        for view, first_width in ((self.treeView_Models, 120), (self.treeView_PrFam, 110)):
+            view.setUpdatesEnabled(False)
+            setup_header_layout(view)
+            view.header().resizeSection(1, first_width)
+            view.setUpdatesEnabled(True)
 
     def _setup_tree_columns(self):
-        # Hide ID columns
-        for c in (Kg.ORDER, Kg.REF, Kg.ID):
-            self.treeView_Models.hideColumn(c)
-            self.treeView_Models.setHeaderHidden(False)
-        for c in (0, 3, 4, 5, 6):
-            self.treeView_PrFam.hideColumn(c)
-            self.treeView_PrFam.setHeaderHidden(False)
+        # Hide ID columns, re-layout each view once
+        for view, columns in ((self.treeView_Models, (Kg.ORDER, Kg.REF, Kg.ID)),
+                              (self.treeView_PrFam, (0, 3, 4, 5, 6))):
+            view.setUpdatesEnabled(False)
+            for c in columns:
+                view.hideColumn(c)
+            view.setHeaderHidden(False)
+            view.setUpdatesEnabled(True)
 
     def _clear_tree_filter(self):
         self.treeView_PrFam.clear_filter()
@@ -476,9 +537,22 @@ class ExcelImportDialog(QDialog):
         close_event.accept()
 
     def _finalize_dialog(self, self_destruct: bool=True):
+        # Let the reader thread return at its next stage instead of blocking the GUI until it finished
         self._abort = True
-        if self.excel_thread.is_alive():
-            self.excel_thread.join()
+        self._abort_event.set()
+        self.pr_update_timer.stop()
 
-        if self_destruct:
+        if not self_destruct:
+            return
+
+        if self.excel_thread.is_alive():
+            self.finalize_timer.start()
+        else:
             self.deleteLater()
+
+    def _destruct_when_finished(self):
+        if self.excel_thread.is_alive():
+            return
+
+        self.finalize_timer.stop()
+        self.deleteLater()
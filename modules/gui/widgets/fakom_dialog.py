@@ -6,7 +6,7 @@ from PySide2.QtWidgets import QDialog, QGroupBox, QLabel, QLineEdit, QToolButton
 from modules import KnechtSettings
 from modules.globals import Resource
 from modules.gui.gui_utils import SetupWidget
-from modules.gui.widgets.path_util import SetDirectoryPath, path_exists
+from modules.gui.widgets.path_util import SetDirectoryPath
 from modules.language import get_translation
 from modules.log import init_logging
 
@@ -17,6 +17,45 @@ lang = get_translation()
 lang.install()
 _ = lang.gettext
 
+_LANG_PATH = _('Pfad:')
+_LANG_PATH_STATUS_TIP = _('Pfad als Text in das Feld kopieren oder über den Dateidialog wählen.')
+_LANG_PATH_BTN_TIP = _('Dateidialog öffnen um Datei oder Verzeichnis auszuwählen.')
+
+# Widget attribute name, setter method, text
+_FAKOM_DIALOG_TRANSLATIONS = (
+    # --- POS Xml ---
+    ('groupBox_fakom', 'setTitle', _('POS Xml Varianten')),
+    ('label_fakomDesc', 'setText', _('DeltaGen POS XML Datei eines Freigabemodells auswählen. '
+                                     'Die Farbschlüssel und Sitzbezug Kombinatorik wird aus den Action '
+                                     'Listen der Xml Struktur gelutscht.')),
+    ('label_fakomPath', 'setText', _LANG_PATH),
+    ('lineEdit_fakom', 'setPlaceholderText', _('POS Xml Variantendatei auswählen...')),
+    ('lineEdit_fakom', 'setStatusTip', _LANG_PATH_STATUS_TIP),
+    ('toolBtn_fakom', 'setStatusTip', _LANG_PATH_BTN_TIP),
+
+    # --- V Plus ---
+    ('groupBox_vplus', 'setTitle', _('V Plus Browserauszug')),
+    ('label_vplus_desc', 'setText', _('Pfad zum V Plus Browserauszug festlegen. Die verfügbaren '
+                                      'Sitzbezüge(SIB), Vordersitze(VOS) und Lederumfänge(LUM) je Trimline '
+                                      'werden ausgelesen.<br/><br/>Im nächsten Schritt können und sollten '
+                                      '<b>Modelfilter</b> gesetzt werden.')),
+    ('label_vplusPath', 'setText', _LANG_PATH),
+    ('lineEdit_vplus', 'setPlaceholderText', _('V Plus Browserauszug auswählen...')),
+    ('lineEdit_vplus', 'setStatusTip', _LANG_PATH_STATUS_TIP),
+    ('toolBtn_vplus', 'setStatusTip', _LANG_PATH_BTN_TIP),
+
+    # --- Info ---
+    ('groupBox_info', 'setTitle', _('Information zu Farbkombinationen')),
+    ('label_info', 'setText', _('<span style=" font-weight:600; color:#aa0000;">ACHTUNG:</span> '
+                                'Die Farb- und Sitzbezugskombinationen werden aus den POS Varianten '
+                                'gelutscht und anschließend mit dem V Plus Browserauszug auf Sitzbezüge, '
+                                'Vordersitze und Lederumfänge abgeglichen. Sitzbezüge die im V Plus Dokument '
+                                'vorhanden sind, nicht aber in den POS Varianten, können nicht berücksichtigt '
+                                'werden.<br/><br/>Dieser Import garantiert keine Vollständigkeit oder Richtigkeit '
+                                'gegenüber der aktuellen FaKom. Er basiert ausschließlich auf der Datengrundlage der '
+                                'POS Varianten des DeltaGen Modells.')),
+    )
+
 
 class FakomImportDialog(QDialog):
     open_fakom_xlsx = Signal(Path, Path)
@@ -36,49 +75,23 @@ class FakomImportDialog(QDialog):
         self.ui.app.aboutToQuit.connect(self.close)
 
         # --- Translations ---
-        path_txt = _('Pfad:')
-        path_status_tip = _('Pfad als Text in das Feld kopieren oder über den Dateidialog wählen.')
-        path_btn_tip = _('Dateidialog öffnen um Datei oder Verzeichnis auszuwählen.')
         self.groupBox_fakom: QGroupBox
-        self.groupBox_fakom.setTitle(_('POS Xml Varianten'))
         self.label_fakomDesc: QLabel
-        self.label_fakomDesc.setText(_('DeltaGen POS XML Datei eines Freigabemodells auswählen. '
-                                       'Die Farbschlüssel und Sitzbezug Kombinatorik wird aus den Action '
-                                       'Listen der Xml Struktur gelutscht.'))
         self.label_fakomPath: QLabel
-        self.label_fakomPath.setText(path_txt)
         self.lineEdit_fakom: QLineEdit
-        self.lineEdit_fakom.setPlaceholderText(_('POS Xml Variantendatei auswählen...'))
-        self.lineEdit_fakom.setStatusTip(path_status_tip)
         self.toolBtn_fakom: QToolButton
-        self.toolBtn_fakom.setStatusTip(path_btn_tip)
 
         self.groupBox_vplus: QGroupBox
-        self.groupBox_vplus.setTitle(_('V Plus Browserauszug'))
         self.label_vplus_desc: QLabel
-        self.label_vplus_desc.setText(_('Pfad zum V Plus Browserauszug festlegen. Die verfügbaren '
-                                        'Sitzbezüge(SIB), Vordersitze(VOS) und Lederumfänge(LUM) je Trimline '
-                                        'werden ausgelesen.<br/><br/>Im nächsten Schritt können und sollten '
-                                        '<b>Modelfilter</b> gesetzt werden.'))
         self.label_vplusPath: QLabel
-        self.label_vplusPath.setText(path_txt)
         self.lineEdit_vplus: QLineEdit
-        self.lineEdit_vplus.setPlaceholderText(_('V Plus Browserauszug auswählen...'))
-        self.lineEdit_vplus.setStatusTip(path_status_tip)
         self.toolBtn_vplus: QToolButton
-        self.toolBtn_vplus.setStatusTip(path_btn_tip)
 
         self.groupBox_info: QGroupBox
-        self.groupBox_info.setTitle(_('Information zu Farbkombinationen'))
         self.label_info: QLabel
-        self.label_info.setText(_('<span style=" font-weight:600; color:#aa0000;">ACHTUNG:</span> '
-                                  'Die Farb- und Sitzbezugskombinationen werden aus den POS Varianten '
-                                  'gelutscht und anschließend mit dem V Plus Browserauszug auf Sitzbezüge, '
-                                  'Vordersitze und Lederumfänge abgeglichen. Sitzbezüge die im V Plus Dokument '
-                                  'vorhanden sind, nicht aber in den POS Varianten, können nicht berücksichtigt '
-                                  'werden.<br/><br/>Dieser Import garantiert keine Vollständigkeit oder Richtigkeit '
-                                  'gegenüber der aktuellen FaKom. Er basiert ausschließlich auf der Datengrundlage der '
-                                  'POS Varianten des DeltaGen Modells.'))
+
+        for widget_name, method_name, text in _FAKOM_DIALOG_TRANSLATIONS:
+            getattr(getattr(self, widget_name), method_name)(text)
 
         # --- POS path UI ---
         self.pos_path = SetDirectoryPath(
@@ -112,12 +125,15 @@ class FakomImportDialog(QDialog):
 
     def verify_paths(self):
         for p in (self.pos_path.path, self.xlsx_path.path):
-            if p is None or not path_exists(p) or not p.is_file():
-                break
-        else:
-            return True
-
-        return False
+            try:
+                # is_file stats the path once and reports missing paths as False
+                if p is None or not p.is_file():
+                    return False
+            except OSError as e:
+                LOGGER.error('Can not access path: %s', e)
+                return False
+
+        return True
 
     def reject(self):
         self.close()
@@ -1,10 +1,10 @@
 import os
+import stat
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 from PySide2 import QtWidgets
 
-from modules.gui.widgets.path_util import path_exists
 from modules.language import get_translation
 from modules.log import init_logging
 from modules.settings import KnechtSettings
@@ -34,6 +34,10 @@ class FileDialog:
         )
     valid_recent_file_types = {'xml', 'xlsx', 'cmd', 'rksession'}
 
+    # Skip per entry icon look ups and symlink resolving if the Qt dialog is used instead of a native one,
+    # both stat every directory entry and are very slow on network drives
+    dialog_options = QtWidgets.QFileDialog.DontUseCustomDirectoryIcons | QtWidgets.QFileDialog.DontResolveSymlinks
+
     @classmethod
     def open(cls,
              parent=None, directory: Union[Path, str]=None, file_key: str= 'xml'
@@ -67,15 +71,16 @@ class FileDialog:
 
         file, file_ext = cls.__create_file_dialog(parent, title, directory, file_filter)
 
-        if file and path_exists(file):
-            if Path(file).suffix != f'.{file_key}':
+        if file and cls._stat(file) is not None:
+            file_path = Path(file)
+            if file_path.suffix != f'.{file_key}':
                 LOGGER.warning(f'User supposed to open: %s but opened: %s - returning None',
-                               f'.{file_key}', Path(file).suffix)
+                               f'.{file_key}', file_path.suffix)
                 return
 
-            KnechtSettings.app['current_path'] = Path(file).parent.as_posix()
+            KnechtSettings.app['current_path'] = file_path.parent.as_posix()
             if file_key in cls.valid_recent_file_types:
-                KnechtSettings.add_recent_file(Path(file).as_posix(), file_key)
+                KnechtSettings.add_recent_file(file_path.as_posix(), file_key)
 
         return file
 
@@ -88,55 +93,63 @@ class FileDialog:
 
         directory = cls.__create_dir_dialog(parent, title, directory)
 
-        if directory and path_exists(directory):
+        if directory and cls._stat(directory) is not None:
             KnechtSettings.app['current_path'] = Path(directory).as_posix()
 
         return directory
 
     # -------------------------------
     # ------- Dialog creation -------
+    # The static QFileDialog functions open the native platform dialog and block
+    # until the user has selected a file/directory or canceled
     @staticmethod
     def __create_file_dialog(parent, title: str, directory: Path, file_filter: str) -> Union[str, None]:
-        # Create and configure File Dialog
-        dlg = QtWidgets.QFileDialog()
-        dlg.setFileMode(QtWidgets.QFileDialog.ExistingFile)
-
-        # This will block until the user has selected a file or canceled
-        return dlg.getOpenFileName(parent, title, directory.as_posix(), file_filter)
+        options = FileDialog.dialog_options | QtWidgets.QFileDialog.ReadOnly
+        return QtWidgets.QFileDialog.getOpenFileName(parent, title, directory.as_posix(), file_filter,
+                                                     options=options)
 
     @staticmethod
     def __create_dir_dialog(parent, title: str, directory: Path) -> Union[str, None]:
-        dlg = QtWidgets.QFileDialog()
-
-        # This will block until the user has selected a directory or canceled
-        return dlg.getExistingDirectory(parent, caption=title, directory=directory.as_posix())
+        # Not read only, users create new output folders in this dialog
+        options = FileDialog.dialog_options | QtWidgets.QFileDialog.ShowDirsOnly
+        return QtWidgets.QFileDialog.getExistingDirectory(parent, caption=title, dir=directory.as_posix(),
+                                                          options=options)
 
     @staticmethod
     def __create_save_dialog(parent, title: str, directory: Path, file_filter: str) -> Union[str, None]:
-        dlg = QtWidgets.QFileDialog()
-        return dlg.getSaveFileName(parent, title, directory.as_posix(), file_filter)
+        return QtWidgets.QFileDialog.getSaveFileName(parent, title, directory.as_posix(), file_filter,
+                                                     options=FileDialog.dialog_options)
 
     # -----------------------------------
     # ------- Path helper methods -------
+    @staticmethod
+    def _stat(p: Union[Path, str]) -> Optional[os.stat_result]:
+        """ One stat call answers existence and file type, None for missing or inaccessible paths """
+        try:
+            return os.stat(p)
+        except OSError:
+            return None
+
     @staticmethod
     def _get_current_path(d) -> Path:
         # Current settings path
-        __c = Path(KnechtSettings.app['current_path'])
+        current_path = KnechtSettings.app['current_path']
         # Fallback path USERPROFILE path or current directory '.'
-        __fallback = Path(os.getenv('USERPROFILE', '.'))
-
-        if not d or not path_exists(d):
-            if KnechtSettings.app['current_path'] not in ['', '.'] and path_exists(__c):
-                # Set to settings current_path and continue with file vs. dir check
-                d = __c
-            else:
-                return __fallback
-
-        if Path(d).is_file():
-            if path_exists(Path(d).parent):
-                # Remove file and return directory
-                return Path(d).parent
-            else:
-                return __fallback
+        fallback = Path(os.getenv('USERPROFILE', '.'))
+
+        d_stat = FileDialog._stat(d) if d else None
+
+        if d_stat is None:
+            if current_path in ('', '.'):
+                return fallback
+
+            # Set to settings current_path and continue with file vs. dir check
+            d, d_stat = current_path, FileDialog._stat(current_path)
+            if d_stat is None:
+                return fallback
+
+        if stat.S_ISREG(d_stat.st_mode):
+            # Remove file and return directory, the parent of an existing file exists
+            return Path(d).parent
 
         return Path(d)
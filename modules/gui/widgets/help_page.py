@@ -17,6 +17,7 @@ _ = lang.gettext
 
 
 class KnechtHelpPage(QWebEngineView):
+    window_title = _('Dokumentation')
     zoom = 1.5
     min_zoom = 1.0
     max_zoom = 3.0
@@ -24,7 +25,7 @@ class KnechtHelpPage(QWebEngineView):
     def __init__(self, ui):
         super(KnechtHelpPage, self).__init__(ui)
         self.ui = ui
-        self.setWindowTitle(_('Dokumentation'))
+        self.setWindowTitle(self.window_title)
 
         self.installEventFilter(self)
         self.setZoomFactor(KnechtHelpPage.zoom)
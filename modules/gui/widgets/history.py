@@ -21,8 +21,7 @@ _ = lang.gettext
 class TimeMachine(QObject):
     finished = Signal()
 
-    work_timer = QTimer()
-    work_timer.setInterval(150)
+    work_interval = 150
 
     def __init__(self, history, stack: QUndoStack, target_idx: int):
         """ Walks across undo indices
@@ -40,6 +39,9 @@ class TimeMachine(QObject):
 
         self.target_idx = target_idx
 
+        # Every time machine walks with its own timer, a shared timer would still call previous machines
+        self.work_timer = QTimer(self)
+        self.work_timer.setInterval(self.work_interval)
         self.work_timer.timeout.connect(self.work)
         self.finished.connect(self.history.time_traveler_arrived)
 
@@ -77,9 +79,6 @@ class DocHistoryWidget(QWidget):
     disabled_flags = (Qt.ItemIsSelectable | Qt.ItemNeverHasChildren)
     enabled_flags = (Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemNeverHasChildren)
 
-    update_view_timer = QTimer()
-    update_view_timer.setSingleShot(100)
-
     bg_grey = QBrush(QColor(220, 240, 220), Qt.SolidPattern)
     fg_black = QBrush(QColor(20, 20, 20))
     fg_grey = QBrush(QColor(120, 120, 120))
@@ -107,6 +106,8 @@ class DocHistoryWidget(QWidget):
         self.tab: QTabWidget = self.ui.srcTabWidget
         self.undo_grp: QUndoGroup = ui.app.undo_grp
         self.time_machine = None
+        # Item marking the current document state, moved between the history items
+        self.current_item: QListWidgetItem = None
 
         # --- Buttons ---
         self.jumpBtn: QPushButton = self.jumpBtn
@@ -133,6 +134,8 @@ class DocHistoryWidget(QWidget):
         self.addActions([self.redo, self.undo])
 
         # --- Update delay ---
+        self.update_view_timer = QTimer(self)
+        self.update_view_timer.setSingleShot(True)
         self.update_view_timer.timeout.connect(self._update_view)
 
         # --- Connect viewList ---
@@ -197,6 +200,9 @@ class DocHistoryWidget(QWidget):
         self.undoWidget.setEnabled(True)
         self.menu_edit.undo_action_grp.setEnabled(True)
 
+        # Show the arrival, the view was not updated for every step of the walk
+        self.update_history_view()
+
     @Slot(QTreeView)
     def view_focus_changed(self, view):
         self.set_active_stack(view.undo_stack)
@@ -206,6 +212,10 @@ class DocHistoryWidget(QWidget):
     def set_active_stack(self, undo_stack: QUndoStack):
         if isinstance(undo_stack, QUndoStack) and undo_stack is not self.active_stack:
             LOGGER.debug('Setting Active Stack: %s %s', undo_stack, isinstance(undo_stack, QUndoStack))
+            if self.time_machine is not None:
+                # The walk stalls on an inactive stack, stop it where it is to keep the view updating
+                self.time_machine.finish()
+
             undo_stack.setActive(True)
             self.active_stack = undo_stack
 
@@ -222,7 +232,7 @@ class DocHistoryWidget(QWidget):
             self.update_view_timer.start()
 
     def _update_view(self):
-        if self.isHidden():
+        if self.isHidden() or self.time_machine is not None:
             return
 
         if not isinstance(self.active_stack, QUndoStack):
@@ -237,11 +247,11 @@ class DocHistoryWidget(QWidget):
 
         LOGGER.debug('Current Stack Index: %s', self.active_stack.index())
 
-        self.viewList.clear()
         self.populate_list_view()
 
     def clean_view(self):
         self.viewList.clear()
+        self.current_item = None
 
         origin = QListWidgetItem(_('Keine Historie Einträge'), self.viewList)
         origin.setIcon(IconRsc.get_icon('history'))
@@ -249,32 +259,50 @@ class DocHistoryWidget(QWidget):
     def populate_list_view(self):
         stack = self.active_stack
         ls = self.viewList
-        ls.clear()
+        ls.setUpdatesEnabled(False)
+
+        # Take out the current state item, the remaining items are the history entries
+        if self.current_item is not None:
+            ls.takeItem(ls.row(self.current_item))
+
+        # Re-use the history items while the stack size does not change, eg. on undo/redo
+        if self.current_item is None or ls.count() != stack.count():
+            ls.clear()
+            history_items = [QListWidgetItem(ls) for c in range(0, stack.count())]
+        else:
+            history_items = [ls.item(c) for c in range(0, stack.count())]
 
         undo_idx = max(0, stack.index() - 1)
         redo_idx = stack.index()
 
-        for c in range(0, stack.count()):
-            txt = stack.text(c)
-            icon = IconRsc.get_icon('history')
+        # Look up the icons once instead of per history entry
+        history_icon, undo_icon, forward_icon = (IconRsc.get_icon(k) for k in ('history', 'undo', 'forward'))
+        update_history_item = self.update_history_item
+
+        for c, item in enumerate(history_items):
+            icon = history_icon
 
             if c == undo_idx:
-                icon = IconRsc.get_icon('undo')
+                icon = undo_icon
 
             if c == redo_idx:
-                icon = IconRsc.get_icon('forward')
+                icon = forward_icon
 
-            self.create_history_item(c, txt, icon, redo_idx)
+            update_history_item(item, c, stack.text(c), icon, redo_idx)
 
-        current_item = self.create_current_item(self.disabled_flags)
-        self.viewList.insertItem(redo_idx, current_item)
+        if self.current_item is None:
+            self.current_item = QListWidgetItem()
+        self.update_current_item(self.current_item, self.disabled_flags)
+        ls.insertItem(redo_idx, self.current_item)
 
-    def create_history_item(self, c: int, txt: str, icon, redo_idx):
+        ls.setUpdatesEnabled(True)
+
+    def update_history_item(self, item: QListWidgetItem, c: int, txt: str, icon, redo_idx):
         num = c - redo_idx
         if num >= 0:
             num += 1
 
-        item = QListWidgetItem(f'{txt} [{num: 3d}]', self.viewList)
+        item.setText(f'{txt} [{num: 3d}]')
         item.setData(Qt.UserRole, c)
         item.setFlags(self.enabled_flags)
         item.setIcon(icon)
@@ -282,15 +310,19 @@ class DocHistoryWidget(QWidget):
         if num > 0:
             item.setForeground(self.fg_grey)
             item.setFont(FontRsc.italic)
+        else:
+            # Reset re-used items to the default style
+            item.setData(Qt.ForegroundRole, None)
+            item.setData(Qt.FontRole, None)
 
         return item
 
-    def create_current_item(self, flags):
+    def update_current_item(self, current_item: QListWidgetItem, flags):
         if self.active_stack.index() == 0:
             txt = _('  0: Geladener Zustand des Dokuments')
         else:
             txt = _('  0: Aktueller Zustand des Dokuments')
-        current_item = QListWidgetItem(txt)
+        current_item.setText(txt)
         current_item.setForeground(self.fg_black)
         current_item.setBackground(self.bg_grey)
         current_item.setFlags(flags)
@@ -27,9 +27,7 @@ _ = lang.gettext
 
 
 class KnechtWolkeUi(QObject):
-    debounce = QTimer()
-    debounce.setSingleShot(True)
-    debounce.setInterval(3500)
+    debounce_interval = 3500
 
     model_loaded = Signal(KnechtModel, Path)
 
@@ -40,6 +38,10 @@ class KnechtWolkeUi(QObject):
         """
         super(KnechtWolkeUi, self).__init__(ui)
         self.ui = ui
+
+        self.debounce = QTimer()
+        self.debounce.setSingleShot(True)
+        self.debounce.setInterval(self.debounce_interval)
         self.ui.connectLabel.setText(_('Verbindung herstellen'))
 
         # --- Prepare Host/Port/User edit ---
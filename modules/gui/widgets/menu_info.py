@@ -4,7 +4,6 @@ from PySide2.QtWidgets import QMenu
 from modules.gui.ui_generic_tab import GenericTabWidget
 from modules.gui.ui_resource import IconRsc
 from modules.gui.widgets.about_page import KnechtAbout
-from modules.gui.widgets.help_page import KnechtHelpPage
 from modules.gui.widgets.welcome_page import KnechtWelcome
 from modules.language import get_translation
 from modules.log import init_logging
@@ -61,13 +60,11 @@ class InfoMenu(QObject):
 
     def show_info_page(self):
         # --- About Page ---
-        about_page = KnechtAbout(self.ui)
-
-        # Skip if view already exists
-        if self.ui.view_mgr.get_view_by_name(about_page.windowTitle()):
-            del about_page
+        # Skip if view already exists, before loading the about page ui file
+        if self.ui.view_mgr.get_view_by_name(KnechtAbout.window_title):
             return
 
+        about_page = KnechtAbout(self.ui)
         GenericTabWidget(self.ui, about_page)
 
     def show_welcome_page(self):
@@ -83,11 +80,12 @@ class InfoMenu(QObject):
 
     def show_docs(self):
         # --- Help Page ---
-        docs_page = KnechtHelpPage(self.ui)
+        # Import on first use, QtWebEngine is expensive to load and most sessions never open the docs
+        from modules.gui.widgets.help_page import KnechtHelpPage
 
         # Skip if view already exists
-        if self.ui.view_mgr.get_view_by_name(docs_page.windowTitle()):
-            del docs_page
+        if self.ui.view_mgr.get_view_by_name(KnechtHelpPage.window_title):
             return
 
+        docs_page = KnechtHelpPage(self.ui)
         GenericTabWidget(self.ui, docs_page)
@@ -213,19 +213,24 @@ class KnechtItem(QObject):
             return False
 
         data = tuple()
+        preset_id_method = kwargs.get('preset_id_method')
+        reference_id_method = kwargs.get('reference_id_method')
+        fixed_user_type = kwargs.get('fixed_userType')
+        new_items = list()
 
         for row in range(count):
             if args:
                 data = args[row]
 
-            item = KnechtItem(self, data,
-                              preset_id_method=kwargs.get('preset_id_method'),
-                              reference_id_method=kwargs.get('reference_id_method'))
-            if kwargs.get('fixed_userType'):
-                item.fixed_userType = kwargs.get('fixed_userType')
+            item = KnechtItem(self, data, preset_id_method=preset_id_method, reference_id_method=reference_id_method)
+            if fixed_user_type:
+                item.fixed_userType = fixed_user_type
 
-            self.childItems.insert(position, item)
-            self.num_children += 1
+            new_items.append(item)
+
+        # Insert all rows at once, keeping the order of the provided data rows
+        self.childItems[position:position] = new_items
+        self.num_children += count
 
         return True
 
@@ -454,6 +459,21 @@ class KnechtItemStyle:
 
         item.itemData[Qt.DecorationRole][column] = icon
 
+    @classmethod
+    def style_children_column(cls, parent_item: KnechtItem, item_type_key: str, column: int=0) -> None:
+        """ Style the column of all children of parent_item with the icon of the same item type """
+        if not column:
+            column = Kg.style_column
+
+        if item_type_key not in cls.ICON_MAP.keys():
+            return
+
+        icon = IconRsc.get_icon(cls.ICON_MAP[item_type_key])
+
+        for item in parent_item.iter_children():
+            if not item.itemData[Qt.DecorationRole][column]:
+                item.itemData[Qt.DecorationRole][column] = icon
+
     @classmethod
     def style_row(cls, item: KnechtItem, role, style_data: Union[QBrush, QFont]) -> None:
         for column in Kg.column_range:
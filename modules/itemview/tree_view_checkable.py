@@ -1,8 +1,11 @@
-from PySide2.QtCore import QEvent, QObject, Qt
+from typing import Iterable, Optional
+
+from PySide2.QtCore import QEvent, QModelIndex, QObject, Qt
 from PySide2.QtWidgets import QAction, QLineEdit, QMenu, QTreeView, QUndoGroup, QWidget
 
 from modules.gui.gui_utils import replace_widget
 from modules.gui.ui_resource import IconRsc
+from modules.itemview.item import KnechtItem
 from modules.itemview.model import KnechtModel
 from modules.itemview.model_globals import KnechtModelGlobals as Kg
 from modules.itemview.model_update import UpdateModel
@@ -57,14 +60,33 @@ class KnechtTreeViewCheckable(KnechtTreeView):
         # most Dialogs do not require a column description
         self.setHeaderHidden(True)
 
-    def check_items(self, check_items: list, column: int,
+    def item_at(self, index: QModelIndex) -> Optional[KnechtItem]:
+        """ Return the source model item of the provided proxy model index or None for invalid indices """
+        if not index.isValid():
+            return None
+
+        return self.model().sourceModel().get_item(self.model().mapToSource(index))
+
+    def check_items(self, check_items: Iterable, column: int,
                     check_all: bool=False, check_none: bool=False, check_selected: bool=False):
         selected_indices, src_model = self.editor.selection.get_selection_top_level()
 
+        # Only write check states the model supports, like KnechtModel.setData would
+        if Qt.CheckStateRole not in src_model.supported_roles or column not in src_model.checkable_columns:
+            return
+
+        # Hashed look up of values or items to check
+        check_set = frozenset(check_items)
+        display_role, check_state_role = Qt.DisplayRole, Qt.CheckStateRole
+
         for (src_index, item) in self.editor.iterator.iterate_view(column=column):
-            value, new_value = item.data(column, role=Qt.DisplayRole), None
+            if not src_index.isValid():
+                continue
 
-            if value in check_items or item in check_items or check_all:
+            new_value = None
+
+            # Only read the display value if there are values to look up
+            if check_all or (check_set and (item in check_set or item.data(column, role=display_role) in check_set)):
                 new_value = Qt.Checked
             elif check_none:
                 new_value = Qt.Unchecked
@@ -74,7 +96,16 @@ class KnechtTreeViewCheckable(KnechtTreeView):
                 else:
                     new_value = Qt.Unchecked
 
-            src_model.setData(src_index, new_value, Qt.CheckStateRole)
+            if new_value is None:
+                continue
+
+            # Update the item directly and report all rows with a single dataChanged signal
+            item.setData(column, new_value, check_state_role)
+
+        row_count = src_model.rowCount()
+        if row_count and not src_model.silent:
+            src_model.dataChanged.emit(src_model.index(0, column), src_model.index(row_count - 1, column),
+                                       [check_state_role])
 
 
 class CheckableViewContext(QMenu):
@@ -111,11 +142,8 @@ class CheckableViewContext(QMenu):
         return 0
 
     def eventFilter(self, obj: QObject, event: QEvent):
-        if obj != self.view:
+        if event.type() != QEvent.ContextMenu or obj is not self.view:
             return False
 
-        if event.type() == QEvent.ContextMenu:
-            self.popup(event.globalPos())
-            return True
-
-        return False
+        self.popup(event.globalPos())
+        return True
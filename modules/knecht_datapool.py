@@ -1,6 +1,7 @@
 import datetime
 import logging
 import sys
+from collections import OrderedDict
 from threading import Event, Thread
 from typing import List, Tuple
 
@@ -63,6 +64,9 @@ class DatapoolConnector:
             },
         }
 
+    # Socket timeout in seconds, a stuck query must not hold the connection until the dialog times out
+    query_timeout = 60
+
     def __init__(self, config: dict):
         # --- config ---
         # config should contain dict(
@@ -78,6 +82,7 @@ class DatapoolConnector:
         # --- MySql Connector object ---
         # Dummy object until we connect
         self.db = mysql.connector.connection.MySQLConnection
+        self._closed = False
 
     def connect_db(self) -> bool:
         """ Establish physical connection to the database
@@ -87,8 +92,11 @@ class DatapoolConnector:
             self._error_msg = _('Keine Datenbankkonfiguration verfügbar. Datapool über das Netzwerk erreichbar?')
             return False
 
+        config = dict(connection_timeout=self.query_timeout)
+        config.update(self.config)
+
         try:
-            self.db = mysql.connector.connect(**self.config)
+            self.db = mysql.connector.connect(**config)
             LOGGER.info('Connecting to database: %s', self.config.get('host'))
         except mysql.connector.Error as err:
             self._set_connection_error(err)
@@ -273,6 +281,10 @@ class DatapoolConnector:
         return self._error_msg
 
     def close(self):
+        if self._closed:
+            return
+        self._closed = True
+
         try:
             self.db.close()
         except Exception as e:
@@ -280,6 +292,8 @@ class DatapoolConnector:
 
 
 class DatapoolThread(Thread):
+    # Number of recently requested projects whose image data is kept
+    image_cache_size = 16
 
     def __init__(self, controller):
         """ Thread fetching data from the database and forwarding it via
@@ -288,12 +302,19 @@ class DatapoolThread(Thread):
         :param DatapoolController controller:
         :param db_config:
         """
-        super(DatapoolThread, self).__init__()
+        # Daemon, a query still running on application exit must not keep the process alive
+        super(DatapoolThread, self).__init__(daemon=True)
         self.controller = controller
         self.db = None
 
         self.exit_event = Event()
+        # Wakes the thread as soon as a project is requested
+        self.request_event = Event()
         self.project_requested = -1
+        self.project_in_progress = -1
+
+        # Image data of recently requested projects
+        self.image_cache: OrderedDict = OrderedDict()
 
     def run(self) -> None:
         self.db = DatapoolConnector(KnechtSettings.load_db_config())
@@ -302,57 +323,97 @@ class DatapoolThread(Thread):
         LOGGER.debug('Connecting to database')
         if not self.db.connect_db():
             self.error(self.db.error_report())
-            self.shutdown()
+            self._close_db()
             return
 
         # Get Project Data
         if not self.db.collect_projects():
             self.error(self.db.error_report())
-            self.shutdown()
+            self._close_db()
             return
 
         # Send Project Data
         LOGGER.debug('Found datapool project data of size: %s', len(self.db.data['project']))
-        self.controller.add_projects.emit(self.db.data['project'])
+        self._emit(self.controller.add_projects, self.db.data['project'])
 
         # Loop and wait for project request
         while not self.exit_event.is_set():
             if self.project_requested != -1:
-                project_id = self.project_requested
+                # Take the request, a new request made while querying will be picked up by the next iteration
+                project_id = self.project_in_progress = self.project_requested
+                self.project_requested = -1
 
-                if not self.db.collect_images(project_id):
-                    self.error(self.db.error_report())
-                    self.db.data['image'][project_id] = dict()
+                images = self._get_project_images(project_id)
 
-                for img_id in self.db.data['image'][project_id]:
-                    # Convert to String data
-                    img_data = list()
-                    for d in self.db.data['image'][project_id][img_id]:
-                        if type(d) == datetime.datetime:
-                            d = d.strftime('%d.%m.%y %H:%M')
-                        img_data.append(str(d))
+                """ (name, priority, created, pr_string, opt_id, produced_image_id) """
+                LOGGER.debug('Transmitting datapool image data of size: %s', len(images))
 
-                    self.db.data['image'][project_id][img_id] = tuple(img_data)
+                self._emit(self.controller.add_images, images)
+                self.project_in_progress = -1
 
-                """ (name, priority, created, pr_string, opt_id, produced_image_id) """
-                LOGGER.debug('Transmitting datapool image data of size: %s', len(self.db.data['image'][project_id]))
+            self.request_event.wait(timeout=0.8)
+            self.request_event.clear()
 
-                self.controller.add_images.emit(self.db.data['image'][project_id])
-                self.project_requested = -1
+        self._close_db()
+
+    def _get_project_images(self, project_id: int) -> dict:
+        """ Return image data of recently requested projects from the cache, query the database otherwise """
+        if project_id in self.image_cache:
+            self.image_cache.move_to_end(project_id)
+            return self.image_cache[project_id]
+
+        if not self.db.collect_images(project_id):
+            self.error(self.db.error_report())
+            return dict()
+
+        for img_id in self.db.data['image'][project_id]:
+            # Convert to String data
+            img_data = list()
+            for d in self.db.data['image'][project_id][img_id]:
+                if type(d) == datetime.datetime:
+                    d = d.strftime('%d.%m.%y %H:%M')
+                img_data.append(str(d))
 
-            self.exit_event.wait(timeout=0.8)
+            self.db.data['image'][project_id][img_id] = tuple(img_data)
 
-        self.shutdown()
+        images = self.db.data['image'][project_id]
+        self.image_cache[project_id] = images
+
+        if len(self.image_cache) > self.image_cache_size:
+            self.image_cache.popitem(last=False)
+
+        return images
 
     def request_project(self, project_id: int):
+        if project_id == self.project_in_progress:
+            # Already querying this project, drop any other project requested in the meantime
+            self.project_requested = -1
+            return
+
         self.project_requested = project_id
+        self.request_event.set()
 
     def error(self, error_msg):
-        self.controller.error.emit(error_msg)
+        self._emit(self.controller.error, error_msg)
+
+    def _emit(self, signal, data):
+        """ Forward data unless the dialog was closed while a query was running """
+        if self.exit_event.is_set():
+            return
+
+        try:
+            signal.emit(data)
+        except RuntimeError as e:
+            # Controller got deleted between the exit check and the emit
+            LOGGER.debug('Datapool controller no longer available: %s', e)
 
     def shutdown(self):
+        """ Ask the thread to exit, the connection is closed by the thread itself once a running query returned """
         self.exit_event.set()
+        self.request_event.set()
 
+    def _close_db(self):
+        """ Only called from the thread owning the connection """
         if self.db:
             self.db.close()
 
@@ -372,20 +433,13 @@ class DatapoolController(QObject):
     def start(self):
         self.db_thread.start()
 
-    def close(self) -> bool:
+    def close(self):
+        """ Ask the thread to exit without blocking the GUI, a running query finishes in the background
+            and its result is dropped.
+        """
         if self.db_thread.is_alive():
             LOGGER.info('Shutting down Datapool Connection Thread.')
             self.db_thread.shutdown()
-            self.db_thread.join(timeout=2)
-
-            if self.db_thread.is_alive():
-                LOGGER.error("Datapool thread could not be joined. Network trouble. We depend on Windows now, "
-                             "aka we're lost.")
-                self.error.emit(_('Netzwerkverbindung konnte nicht beendet werden. Bitte warten und in einer Minute '
-                                  'erneut versuchen.'))
-                return False
-
-        return True
 
     def request_project(self, project_id: str):
         self.db_thread.request_project(int(project_id))
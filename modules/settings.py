@@ -2,6 +2,7 @@ import ujson
 import os
 import time
 import zlib
+from collections import OrderedDict
 from pathlib import Path
 from typing import Union, Any
 
@@ -176,7 +177,8 @@ class KnechtSettings:
         last_pos_file='',
         last_xlsx_file='',
         )
-    excel = list()
+    # Excel import settings by file path, most recent first
+    excel = OrderedDict()
 
     language = 'de'
 
@@ -234,6 +236,12 @@ class KnechtSettings:
 
         cls.app['recent_files'] = updated_recent_files
 
+        # Excel import settings of previous versions are stored as list of entries
+        if isinstance(cls.excel, list):
+            cls.excel = OrderedDict((entry.get('file'), entry) for entry in cls.excel if entry.get('file'))
+        else:
+            cls.excel = OrderedDict(cls.excel)
+
         cls.setup_lang()
         print('KnechtSettings successfully loaded from file.')
 
@@ -292,6 +300,24 @@ class KnechtSettings:
         if len(recent_files) > 10:
             cls.app['recent_files'] = recent_files[:10]
 
+    @classmethod
+    def add_excel_settings(cls, file: Union[Path, str], settings: dict) -> None:
+        """ Store the excel import settings of file as most recent entry and keep the last 5 entries.
+
+            The dict is rebuilt instead of re-ordered with move_to_end, ujson saves
+            an OrderedDict in the order its entries were inserted.
+        """
+        file_str = Path(file).as_posix()
+        excel = OrderedDict([(file_str, settings)])
+
+        for entry_file, entry in cls.excel.items():
+            if len(excel) >= 5:
+                break
+            if entry_file != file_str:
+                excel[entry_file] = entry
+
+        cls.excel = excel
+
     @staticmethod
     def get_settings_path() -> str:
         _knecht_settings_dir = get_settings_dir()
@@ -0,0 +1,58 @@
+import tempfile
+import unittest
+from collections import OrderedDict
+from pathlib import Path
+from unittest import mock
+
+from modules.settings import KnechtSettings, delayed_log_setup
+
+
+class KnechtSettingsExcelTest(unittest.TestCase):
+    def setUp(self):
+        delayed_log_setup()
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.settings_file = Path(self.temp_dir.name) / 'settings.json'
+        self.excel = KnechtSettings.excel
+        KnechtSettings.excel = OrderedDict()
+
+    def tearDown(self):
+        KnechtSettings.excel = self.excel
+        self.temp_dir.cleanup()
+
+    def _save_and_load(self):
+        # Windows locale names are not available on every test system
+        with mock.patch.object(KnechtSettings, 'get_settings_path', return_value=self.settings_file.as_posix()), \
+                mock.patch.object(KnechtSettings, 'setup_lang'):
+            KnechtSettings.save()
+            KnechtSettings.excel = OrderedDict()
+            KnechtSettings.load()
+
+    @staticmethod
+    def _add(file_name: str):
+        KnechtSettings.add_excel_settings(file_name, dict(file=file_name))
+
+    def test_save_load_keeps_most_recent_first(self):
+        for file_name in ('a.xlsx', 'b.xlsx', 'c.xlsx', 'd.xlsx', 'e.xlsx'):
+            self._add(file_name)
+        # Re-use an older file, it becomes the most recent entry
+        self._add('b.xlsx')
+
+        self._save_and_load()
+        self.assertEqual(list(KnechtSettings.excel), ['b.xlsx', 'e.xlsx', 'd.xlsx', 'c.xlsx', 'a.xlsx'])
+
+        # A new file evicts the least recently used entry
+        self._add('f.xlsx')
+        self._save_and_load()
+        self.assertEqual(list(KnechtSettings.excel), ['f.xlsx', 'b.xlsx', 'e.xlsx', 'd.xlsx', 'c.xlsx'])
+        self.assertEqual(KnechtSettings.excel['b.xlsx'], dict(file='b.xlsx'))
+
+    def test_load_converts_list_of_previous_versions(self):
+        KnechtSettings.excel = [dict(file='a.xlsx'), dict(file='b.xlsx')]
+
+        self._save_and_load()
+        self.assertIsInstance(KnechtSettings.excel, OrderedDict)
+        self.assertEqual(list(KnechtSettings.excel), ['a.xlsx', 'b.xlsx'])
+
+
+if __name__ == '__main__':
+    unittest.main()